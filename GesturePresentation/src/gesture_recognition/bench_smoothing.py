@@ -0,0 +1,90 @@
+#bench_smoothing.py
+#Compare swipe detection latency of the landmark smoothing stages
+
+"""
+Replays synthetic swipes through a simulated pipeline: each frame is
+captured at t, its landmarks become available at t + latency, are smoothed
+by the stage under test and fed to GestureDetector at that moment.
+
+Detection latency is measured from the true start of the hand motion to
+the frame on which detect_finger_motion_gesture() reports it.
+
+    python -m gesture_recognition.bench_smoothing --fps 30 --latency 0.06 --jitter 0.002 0.006 0.01
+"""
+
+import sys
+
+from gesture_recognition.gesture_detector import GestureDetector
+from gesture_recognition.landmark_filters import create_landmark_filter, SMOOTHING_MODES
+from gesture_recognition.synthetic import SyntheticStream
+from utils.stats import percentile
+
+SWIPES = ("right", "left", "up", "down")
+
+
+def _swipe_frames(stream, repeats):
+    for i in range(repeats):
+        yield from stream.neutral(1.0)
+        yield from stream.swipe(SWIPES[i % len(SWIPES)], duration=0.3)
+
+
+def run_mode(mode, fps=30, latency=0.06, jitter=0.002, repeats=200, smoothing_window=5, seed=0):
+    stream = SyntheticStream(fps=fps, seed=seed, jitter=jitter)
+    smoother = create_landmark_filter(mode, max_num_hands=1, smoothing_window=smoothing_window)
+    detector = GestureDetector()
+
+    delays, missed, false_hits = [], 0, 0
+    pending = None  # (label, motion start time)
+    previous_label = None
+    for t, hands, label in _swipe_frames(stream, repeats):
+        if label is not None and label != previous_label:
+            if pending is not None:
+                missed += 1
+            pending = (label, t - stream.dt)  # hand starts moving right after the previous frame
+        previous_label = label
+
+        now = t + latency
+        smoothed = smoother.update(hands, t, now)
+        if not smoothed:
+            continue
+        gesture = detector.detect_gesture(smoothed[0], now)
+        if gesture is None or not gesture.startswith("fingers_"):
+            continue
+        if pending is not None and gesture == pending[0]:
+            delays.append(now - pending[1])
+            pending = None
+        else:
+            false_hits += 1
+    if pending is not None:
+        missed += 1
+    return delays, missed, false_hits
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Swipe detection latency per smoothing mode")
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--latency", type=float, default=0.06, help="capture-to-landmarks latency (s)")
+    parser.add_argument("--jitter", type=float, nargs="+", default=[0.002, 0.006],
+                        help="landmark noise std-dev(s); precision differs between modes as it grows")
+    parser.add_argument("--repeats", type=int, default=200)
+    parser.add_argument("--window", type=int, default=5, help="moving-average window (frames)")
+    args = parser.parse_args(argv)
+
+    print(f"{args.repeats} swipes at {args.fps:g} fps, pipeline latency {args.latency * 1e3:.0f} ms")
+    print(f"{'mode':<12} {'jitter':>7} {'p50 ms':>8} {'p95 ms':>8} {'mean ms':>8} {'missed':>7} {'false':>6}")
+    for jitter in args.jitter:
+        for mode in SMOOTHING_MODES:
+            delays, missed, false_hits = run_mode(
+                mode, fps=args.fps, latency=args.latency, jitter=jitter,
+                repeats=args.repeats, smoothing_window=args.window
+            )
+            delays.sort()
+            mean = sum(delays) / len(delays) if delays else float("nan")
+            print(f"{mode:<12} {jitter:7g} {percentile(delays, 50) * 1e3:8.1f} "
+                  f"{percentile(delays, 95) * 1e3:8.1f} {mean * 1e3:8.1f} {missed:7d} {false_hits:6d}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
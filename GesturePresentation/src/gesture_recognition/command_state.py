@@ -0,0 +1,116 @@
+#command_state.py
+#Command mode / hold-to-confirm state machine, driven by per-frame timestamps
+
+"""
+The temporal part of the gesture -> action path, taken out of main():
+
+- Open Palm turns command mode on, Fist turns it off (mode_cooldown between toggles)
+- In command mode, Zoom In / Zoom Out fire at once (zoom_cooldown between them)
+- Other mapped gestures fire after being held for hold_duration_required
+- After a hold action, all frames (toggles and zooms too) are ignored for action_pause seconds
+
+It never reads a clock: every update() gets the timestamp of the frame the
+gesture was detected on. Live capture passes time.monotonic() taken right
+after cap.read(); a replay passes the recorded timestamps, so a session
+replayed at any speed produces the same actions at the same frames.
+"""
+
+from presentation_control.gesture_map import HOLD_GESTURE_ACTIONS, INSTANT_GESTURE_ACTIONS
+
+MODE_ON = "mode_on"
+MODE_OFF = "mode_off"
+INSTANT = "instant"
+HOLD = "hold"
+
+
+class CommandStep:
+    """
+    Outcome of one update(). event is None, MODE_ON, MODE_OFF, INSTANT or HOLD;
+    action is the action name to perform for INSTANT / HOLD.
+    hold_progress is 0..1 while a hold gesture is being confirmed.
+    """
+
+    __slots__ = ("gesture", "event", "action", "hold_progress")
+
+    def __init__(self, gesture, event=None, action=None, hold_progress=None):
+        self.gesture = gesture
+        self.event = event
+        self.action = action
+        self.hold_progress = hold_progress
+
+    def __repr__(self):
+        return f"CommandStep({self.gesture!r}, event={self.event!r}, action={self.action!r})"
+
+
+class CommandStateMachine:
+    def __init__(
+        self,
+        hold_duration_required=0.8,
+        mode_cooldown=0.8,
+        zoom_cooldown=0.6,
+        action_pause=0.2,
+        hold_actions=None,
+        instant_actions=None
+    ):
+        self.hold_duration_required = hold_duration_required
+        self.mode_cooldown = mode_cooldown
+        self.zoom_cooldown = zoom_cooldown
+        self.action_pause = action_pause
+        self.hold_actions = HOLD_GESTURE_ACTIONS if hold_actions is None else hold_actions
+        self.instant_actions = INSTANT_GESTURE_ACTIONS if instant_actions is None else instant_actions
+        self.reset()
+
+    def reset(self):
+        self.command_mode = False
+        self.gesture_active = None
+        self.gesture_start_time = 0
+        self.last_command_time = float("-inf")
+        self.last_zoom_time = float("-inf")
+        self.paused_until = float("-inf")
+
+    def _clear_hold(self):
+        self.gesture_active = None
+        self.gesture_start_time = 0
+
+    def update(self, gesture, now):
+        # Nothing fires right after a hold action (the loop used to sleep here)
+        if now < self.paused_until:
+            self._clear_hold()
+            return CommandStep(gesture)
+
+        # Command Mode toggling
+        if gesture == "Open Palm" and not self.command_mode and now - self.last_command_time > self.mode_cooldown:
+            self.command_mode = True
+            self.last_command_time = now
+            self._clear_hold()
+            return CommandStep(gesture, MODE_ON)
+        if self.command_mode and gesture == "Fist" and now - self.last_command_time > self.mode_cooldown:
+            self.command_mode = False
+            self.last_command_time = now
+            self._clear_hold()
+            return CommandStep(gesture, MODE_OFF)
+
+        if not self.command_mode:
+            self._clear_hold()
+            return CommandStep(gesture)
+
+        # Instant Zoom In/Out
+        if gesture in self.instant_actions and now - self.last_zoom_time > self.zoom_cooldown:
+            self.last_zoom_time = now
+            return CommandStep(gesture, INSTANT, self.instant_actions[gesture])
+
+        if gesture not in self.hold_actions:
+            self._clear_hold()
+            return CommandStep(gesture)
+
+        if gesture != self.gesture_active:
+            self.gesture_active = gesture
+            self.gesture_start_time = now
+            return CommandStep(gesture)
+
+        elapsed = now - self.gesture_start_time
+        if elapsed >= self.hold_duration_required:
+            self._clear_hold()
+            self.paused_until = now + self.action_pause
+            return CommandStep(gesture, HOLD, self.hold_actions[gesture], hold_progress=1.0)
+        return CommandStep(gesture, hold_progress=elapsed / self.hold_duration_required)
@@ -1,8 +1,11 @@
-import numpy as np
 from collections import deque
 import time
 import json
 import os
+from gesture_recognition.hand_features import (
+    HandFeatures, FINGER_TIPS, FINGER_PIPS,
+    WRIST, THUMB_TIP, INDEX_MCP, INDEX_TIP, MIDDLE_PIP, MIDDLE_TIP
+)
 
 # ------- Calibration settings loader -------
 SETTINGS_PATH = os.path.join(os.path.dirname(__file__), "settings", "gesture_settings.json")
@@ -12,7 +15,9 @@ DEFAULT_SETTINGS = {
     "scroll_vertical_threshold": 0.04,
     "finger_motion_cooldown": 0.8,
     "zoom_cooldown": 0.6,
-    "smoothing_window": 5
+    "smoothing_window": 5,
+    "smoothing_mode": "average",
+    "target_fps": 20
 }
 
 def load_gesture_settings():
@@ -35,54 +40,49 @@ class GestureDetector:
     - Added static: L Gesture, Single Point, C-Shape, Rock Sign / Horns
     """
 
-    def __init__(self):
-        # Load calibration settings
-        settings = load_gesture_settings()
+    def __init__(self, settings=None, clock=time.monotonic):
+        # Fallback clock for cooldowns when detect_gesture() gets no frame timestamp
+        self.clock = clock
+        # Calibration settings; replay/tuning tools pass their own
+        settings = load_gesture_settings() if settings is None else {**DEFAULT_SETTINGS, **settings}
         self.finger_motion_cooldown = settings["finger_motion_cooldown"]
         self.zoom_cooldown = settings["zoom_cooldown"]
         self.finger_motion_buffer = deque(maxlen=10)  # You could set maxlen to settings["smoothing_window"] if desired
         self.swipe_threshold = settings["swipe_horizontal_threshold"]
         self.scroll_threshold = settings["scroll_vertical_threshold"]
 
-        self.FINGER_TIPS = [4, 8, 12, 16, 20]
-        self.FINGER_PIPS = [3, 6, 10, 14, 18]
+        self.FINGER_TIPS = FINGER_TIPS
+        self.FINGER_PIPS = FINGER_PIPS
 
-        self.last_finger_motion_time = 0
+        self.last_finger_motion_time = float("-inf")
 
         # For zoom gesture history
         self.zoom_history = deque(maxlen=5)
-        self.last_zoom_action_time = 0
+        self.last_zoom_action_time = float("-inf")
 
     # --- Static Gestures Helper ---
+    # Every predicate takes a HandFeatures (raw landmarks are wrapped on the fly),
+    # so geometry shared between predicates is computed once per frame.
 
     def fingers_up(self, l):
-        fingers = []
-        # Thumb: right hand logic
-        fingers.append(l[4][0] < l[3][0])
-        for ti, pi in zip(self.FINGER_TIPS[1:], self.FINGER_PIPS[1:]):
-            fingers.append(l[ti][1] < l[pi][1])
-        return fingers  # list of bools [thumb, index, middle, ring, pinky]
+        return HandFeatures.of(l).fingers  # tuple of bools (thumb, index, middle, ring, pinky)
 
     def fingers_count(self, l):
         return sum(self.fingers_up(l))
     
     def is_fist(self, l):
-        fingers = self.fingers_up(l)
+        f = HandFeatures.of(l)
+        fingers = f.fingers
         all_fingers_down = not any(fingers)
-        thumb_tip = l[4][:2]
-        wrist = l[0][:2]
-        index_base = l[5][:2]
-        thumb_dist = np.min([np.linalg.norm(thumb_tip - wrist), np.linalg.norm(thumb_tip - index_base)])
+        thumb_dist = min(f.dist(THUMB_TIP, WRIST), f.dist(THUMB_TIP, INDEX_MCP))
         return all_fingers_down or (not any(fingers[1:]) and thumb_dist < 0.09)
 
     def is_thumbs_up(self, l):
-        fingers = self.fingers_up(l)
+        f = HandFeatures.of(l)
+        fingers = f.fingers
         thumb_up = fingers[0]
         others_down = not any(fingers[1:])
-        thumb_tip = l[4][:2]
-        wrist = l[0][:2]
-        thumb_dist = np.linalg.norm(thumb_tip - wrist)
-        return thumb_up and others_down and thumb_dist > 0.13
+        return thumb_up and others_down and f.dist(THUMB_TIP, WRIST) > 0.13
 
     def is_open_palm(self, l):
         return all(self.fingers_up(l))
@@ -92,21 +92,12 @@ class GestureDetector:
         return fingers[1] and fingers[2] and not fingers[0] and not fingers[3] and not fingers[4]
 
     def is_ok_sign(self, l):
-        thumb_tip = l[4][:2]
-        index_tip = l[8][:2]
-        dist = np.linalg.norm(thumb_tip - index_tip)
-        fingers = self.fingers_up(l)
-        return dist < 0.06 and not fingers[3] and not fingers[4]
+        f = HandFeatures.of(l)
+        fingers = f.fingers
+        return f.dist(THUMB_TIP, INDEX_TIP) < 0.06 and not fingers[3] and not fingers[4]
 
     def palm_direction(self, l):
-        base_vec = l[5][:2] - l[17][:2]
-        if abs(base_vec[1]) < 0.03:
-            return None
-        if base_vec[1] > 0.03:
-            return "Palm Left"
-        elif base_vec[1] < -0.03:
-            return "Palm Right"
-        return None
+        return HandFeatures.of(l).palm_direction
 
     def number_gesture(self, l):
         fingers = self.fingers_up(l)
@@ -130,13 +121,10 @@ class GestureDetector:
         return (not fingers[0] and fingers[1] and not fingers[2] and not fingers[3] and not fingers[4])
 
     def is_c_shape(self, l):
-        fingers = self.fingers_up(l)
-        thumb_tip = l[4][:2]
-        wrist = l[0][:2]
-        middle_pip = l[10][:2]
-        middle_tip = l[12][:2]
-        thumb_far = np.linalg.norm(thumb_tip - wrist) > 0.1
-        middle_bent = middle_tip[1] > middle_pip[1]
+        f = HandFeatures.of(l)
+        fingers = f.fingers
+        thumb_far = f.dist(THUMB_TIP, WRIST) > 0.1
+        middle_bent = f.landmarks[MIDDLE_TIP][1] > f.landmarks[MIDDLE_PIP][1]
         not_open_palm = not all(fingers)
         some_fingers_up = sum(fingers) > 0 and sum(fingers) < 5
         return thumb_far and middle_bent and not_open_palm and some_fingers_up
@@ -148,13 +136,14 @@ class GestureDetector:
     # --- Dynamic Finger Motion Gestures ---
 
     def update_finger_motion_buffer(self, l):
-        index_tip = l[8][:2]
-        middle_tip = l[12][:2]
+        landmarks = HandFeatures.of(l).landmarks
+        index_tip = landmarks[INDEX_TIP]
+        middle_tip = landmarks[MIDDLE_TIP]
         avg_x = (index_tip[0] + middle_tip[0]) / 2
         avg_y = (index_tip[1] + middle_tip[1]) / 2
         self.finger_motion_buffer.append((avg_x, avg_y))
 
-    def detect_finger_motion_gesture(self):
+    def detect_finger_motion_gesture(self, now=None):
         if len(self.finger_motion_buffer) < 5:
             return None
         start_pos = self.finger_motion_buffer[0]
@@ -166,7 +155,8 @@ class GestureDetector:
         HORIZONTAL_THRESHOLD = self.swipe_threshold
         VERTICAL_THRESHOLD = self.scroll_threshold
 
-        now = time.time()
+        if now is None:
+            now = self.clock()
         if now - self.last_finger_motion_time < self.finger_motion_cooldown:
             return None
 
@@ -183,18 +173,19 @@ class GestureDetector:
     # --- Zoom In/Out by pinching/spreading fingers ---
 
     def _fingertip_dist_sum(self, l):
-        thumb, index, middle = l[4][:2], l[8][:2], l[12][:2]
-        d1 = np.linalg.norm(thumb - index)
-        d2 = np.linalg.norm(thumb - middle)
-        d3 = np.linalg.norm(index - middle)
+        f = HandFeatures.of(l)
+        d1 = f.dist(THUMB_TIP, INDEX_TIP)
+        d2 = f.dist(THUMB_TIP, MIDDLE_TIP)
+        d3 = f.dist(INDEX_TIP, MIDDLE_TIP)
         return (d1 + d2 + d3) / 3
 
-    def detect_zoom(self, l):
+    def detect_zoom(self, l, now=None):
         current_dist = self._fingertip_dist_sum(l)
         self.zoom_history.append(current_dist)
         if len(self.zoom_history) < self.zoom_history.maxlen:
             return None
-        now = time.time()
+        if now is None:
+            now = self.clock()
         if now - self.last_zoom_action_time < self.zoom_cooldown:
             return None
         delta = self.zoom_history[-1] - self.zoom_history[0]
@@ -211,9 +202,19 @@ class GestureDetector:
 
     # --- Main gesture detect method ---
 
-    def detect_gesture(self, l):
+    def detect_gesture(self, l, now=None):
+        """
+        now: timestamp of the frame the landmarks come from (monotonic seconds).
+        Cooldowns run on these timestamps, so recorded frames replayed at any
+        speed give the same result as live. Defaults to self.clock().
+        """
+        if now is None:
+            now = self.clock()
+        # Geometry is computed once here and shared by all predicates below
+        l = HandFeatures.of(l)
+
         # Priority: Zoom first
-        zoom_gesture = self.detect_zoom(l)
+        zoom_gesture = self.detect_zoom(l, now)
         if zoom_gesture:
             return zoom_gesture
 
@@ -247,7 +248,7 @@ class GestureDetector:
 
         # Dynamic finger motion gestures
         self.update_finger_motion_buffer(l)
-        fm_gesture = self.detect_finger_motion_gesture()
+        fm_gesture = self.detect_finger_motion_gesture(now)
         if fm_gesture:
             return fm_gesture
 
@@ -0,0 +1,95 @@
+#hand_features.py
+#Per-frame hand geometry, computed once and shared by every gesture predicate
+
+import numpy as np
+
+WRIST = 0
+THUMB_IP, THUMB_TIP = 3, 4
+INDEX_MCP, INDEX_TIP = 5, 8
+MIDDLE_MCP, MIDDLE_PIP, MIDDLE_TIP = 9, 10, 12
+PINKY_MCP = 17
+
+FINGER_TIPS = [4, 8, 12, 16, 20]
+FINGER_PIPS = [3, 6, 10, 14, 18]
+
+# Points whose pairwise 2D distances the predicates use: the five fingertips
+# plus the wrist and index MCP (thumb-to-wrist / thumb-to-index-base checks)
+KEY_POINTS = (THUMB_TIP, INDEX_TIP, MIDDLE_TIP, 16, 20, WRIST, INDEX_MCP)
+_KEY_INDEX = {lm: i for i, lm in enumerate(KEY_POINTS)}
+_KEY_POINTS = np.array(KEY_POINTS)
+_TIPS = np.array(FINGER_TIPS[1:])
+_PIPS = np.array(FINGER_PIPS[1:])
+
+_UNSET = object()
+
+
+class HandFeatures:
+    """
+    Geometry of one hand in one frame. Every field is computed on first use
+    and cached, so predicates can share it without recomputing anything.
+
+    - landmarks:   raw (21, 3) normalized landmarks
+    - distances:   pairwise 2D distance matrix over KEY_POINTS (one vectorized call)
+    - normalized:  landmarks relative to the wrist, scaled by wrist->middle MCP length
+    - fingers:     (thumb, index, middle, ring, pinky) extended flags
+    - palm_direction: "Palm Left" / "Palm Right" / None
+    """
+
+    __slots__ = ("landmarks", "_distances", "_normalized", "_fingers", "_palm_direction")
+
+    def __init__(self, landmarks):
+        self.landmarks = np.asarray(landmarks, dtype=float)
+        self._distances = None
+        self._normalized = None
+        self._fingers = None
+        self._palm_direction = _UNSET
+
+    @classmethod
+    def of(cls, hand):
+        """
+        Accept either a HandFeatures or raw landmarks.
+        """
+        return hand if isinstance(hand, cls) else cls(hand)
+
+    @property
+    def distances(self):
+        if self._distances is None:
+            pts = self.landmarks[_KEY_POINTS, :2]
+            diff = pts[:, None, :] - pts[None, :, :]
+            self._distances = np.sqrt((diff * diff).sum(axis=-1))
+        return self._distances
+
+    def dist(self, a, b):
+        """
+        2D distance between two landmarks from KEY_POINTS.
+        """
+        return float(self.distances[_KEY_INDEX[a], _KEY_INDEX[b]])
+
+    @property
+    def normalized(self):
+        if self._normalized is None:
+            rel = self.landmarks - self.landmarks[WRIST]
+            scale = np.linalg.norm(rel[MIDDLE_MCP, :2])
+            self._normalized = rel / scale if scale > 1e-6 else rel
+        return self._normalized
+
+    @property
+    def fingers(self):
+        if self._fingers is None:
+            l = self.landmarks
+            # Thumb: right hand logic (x), other fingers: tip above PIP (y)
+            others = l[_TIPS, 1] < l[_PIPS, 1]
+            self._fingers = (bool(l[THUMB_TIP, 0] < l[THUMB_IP, 0]),) + tuple(others.tolist())
+        return self._fingers
+
+    @property
+    def palm_direction(self):
+        if self._palm_direction is _UNSET:
+            base_dy = self.landmarks[INDEX_MCP, 1] - self.landmarks[PINKY_MCP, 1]
+            if base_dy > 0.03:
+                self._palm_direction = "Palm Left"
+            elif base_dy < -0.03:
+                self._palm_direction = "Palm Right"
+            else:
+                self._palm_direction = None
+        return self._palm_direction
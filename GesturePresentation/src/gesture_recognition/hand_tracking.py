@@ -5,7 +5,8 @@
 import cv2
 import mediapipe as mp
 import numpy as np
-from collections import deque
+import time
+from gesture_recognition.landmark_filters import create_landmark_filter
 
 class HandTracker:
     def __init__(
@@ -13,45 +14,76 @@ class HandTracker:
         max_num_hands=2,
         min_detection_confidence=0.8,
         min_tracking_confidence=0.7,
-        model_complexity=0.6,  # 0.6 for speed, 1 for accuracy change as u wish
-        smoothing_window=5 # Smoothing window for landmark history
+        model_complexity=0,  # 0 for speed, 1 for accuracy change as u wish
+        smoothing_window=5, # Smoothing window for landmark history
+        input_width=None,   # Downscale frames to this width before inference (None = full size)
+        smoothing_mode="average"  # "average" (moving average) or "predictive" (Kalman, predicts to now)
     ):
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=max_num_hands,
-            model_complexity=model_complexity,
-            min_detection_confidence=min_detection_confidence,
-            min_tracking_confidence=min_tracking_confidence
-        )
+        self.max_num_hands = max_num_hands
+        self.min_detection_confidence = min_detection_confidence
+        self.min_tracking_confidence = min_tracking_confidence
+        self.model_complexity = model_complexity
+        self.input_width = input_width
+        self.hands = self._create_hands()
         self.mp_drawing = mp.solutions.drawing_utils
         self.smoothing_window = smoothing_window
-        # For each hand, keep history for smoothing
-        self.landmark_history = [deque(maxlen=smoothing_window) for _ in range(max_num_hands)]
+        self.smoothing_mode = smoothing_mode
+        self.landmark_filter = create_landmark_filter(smoothing_mode, max_num_hands, smoothing_window)
+        self.last_inference_time = 0.0  # seconds spent in hands.process() for the last frame
+
+    def _create_hands(self):
+        return self.mp_hands.Hands(
+            static_image_mode=False,
+            max_num_hands=self.max_num_hands,
+            model_complexity=self.model_complexity,
+            min_detection_confidence=self.min_detection_confidence,
+            min_tracking_confidence=self.min_tracking_confidence
+        )
+
+    def reconfigure(self, model_complexity, input_width, max_num_hands):
+        """
+        Switch quality settings at runtime. The MediaPipe graph is only rebuilt
+        when model_complexity or max_num_hands actually change.
+        """
+        self.input_width = input_width
+        if model_complexity == self.model_complexity and max_num_hands == self.max_num_hands:
+            return
+        self.model_complexity = model_complexity
+        self.max_num_hands = max_num_hands
+        self.hands.close()
+        self.hands = self._create_hands()
+        self.landmark_filter.reset(max_num_hands)
 
-    def process_frame(self, frame):
+    def process_frame(self, frame, timestamp=None):
+        """
+        `timestamp` is the time.monotonic() capture time of the frame; the
+        predictive stage extrapolates from it to the moment landmarks are ready.
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
         frame = cv2.flip(frame, 1)
         rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        h, w = rgb_frame.shape[:2]
+        if self.input_width and w > self.input_width:
+            # Landmarks are normalized, so inference can run on a smaller copy
+            scale = self.input_width / w
+            rgb_frame = cv2.resize(rgb_frame, (self.input_width, int(h * scale)),
+                                   interpolation=cv2.INTER_AREA)
+        start = time.perf_counter()
         results = self.hands.process(rgb_frame)
-        smoothed_landmarks = []
+        self.last_inference_time = time.perf_counter() - start
+        raw_landmarks = []
 
         if results.multi_hand_landmarks:
-            for idx, hand_landmarks in enumerate(results.multi_hand_landmarks):
+            for hand_landmarks in results.multi_hand_landmarks:
                 # Draw landmarks
                 self.mp_drawing.draw_landmarks(
                     frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
-                
-                # Store & Smooth landmarks
-                landmarks = np.array([(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark])
-                self.landmark_history[idx].append(landmarks)
-                # Compute average across history window
-                smoothed = np.mean(self.landmark_history[idx], axis=0)
-                smoothed_landmarks.append(smoothed)
-        else:
-            # Clear histories if no hands detected
-            for hist in self.landmark_history:
-                hist.clear()
+                raw_landmarks.append(np.array([(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark]))
 
+        # Smooth (moving average) or filter + predict to now; an empty list resets the stage
+        smoothed_landmarks = self.landmark_filter.update(raw_landmarks, timestamp, time.monotonic())
         return frame, smoothed_landmarks
 
 def main():
@@ -5,10 +5,13 @@ import time
 import json
 from gesture_recognition.hand_tracking import HandTracker
 from gesture_recognition.gesture_detector import GestureDetector
-from presentation_control.control import (
-    next_slide, previous_slide, start_slideshow, stop_slideshow,
-    zoom_in, zoom_out, pointer_toggle, scroll_up, scroll_down, play_feedback_sound
-)
+from gesture_recognition.quality_controller import QualityController
+from gesture_recognition.command_state import CommandStateMachine, MODE_ON, MODE_OFF
+from gesture_recognition.replay import SessionRecorder
+from presentation_control.control import perform_action, play_feedback_sound
+from presentation_control.event_bus import GestureEventBus
+from utils.profiling import ProfilingHooks
+from ui.overlay import OverlayState, draw_overlay_cv2, gesture_color
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
@@ -20,7 +23,9 @@ DEFAULT_SETTINGS = {
     "scroll_vertical_threshold": 0.04,
     "finger_motion_cooldown": 0.8,
     "zoom_cooldown": 0.6,
-    "smoothing_window": 5
+    "smoothing_window": 5,
+    "smoothing_mode": "average",
+    "target_fps": 20
 }
 def load_gesture_settings():
     if os.path.exists(SETTINGS_PATH):
@@ -33,186 +38,151 @@ def load_gesture_settings():
     return DEFAULT_SETTINGS.copy()
 # -------------------------------------------------
 
-def main():
-    # Load user/calibrated gesture settings
-    settings = load_gesture_settings()
+def run_pipeline(settings, frame_slot=None, headless=False, profiler=None):
+    """
+    Capture -> track -> detect -> act loop.
+    frame_slot: hand frames + overlay to the Qt window (ui/main_window.py) instead
+    of drawing them with OpenCV; headless: no preview at all.
+    profiler: ProfilingHooks with the SIGUSR1 handler already installed; needed
+    when this runs on a worker thread, where signal handlers cannot be installed.
+    """
     cap = cv2.VideoCapture(0)
     tracker = HandTracker(
         max_num_hands=1,
         min_detection_confidence=0.8,
         min_tracking_confidence=0.7,
         model_complexity=1,
-        smoothing_window=settings["smoothing_window"]
+        smoothing_window=settings["smoothing_window"],
+        smoothing_mode=settings["smoothing_mode"]
     )
-    detector = GestureDetector()
-
-    command_mode = False
-    last_command_time = 0
-    mode_cooldown = 0.8
-    gesture_active = None
-    gesture_start_time = 0
-    hold_duration_required = settings["hold_duration_required"]
-    last_zoom_time = 0
-    zoom_cooldown = 0.6
+    # Trade model complexity / resolution for speed to hold target_fps (0 disables)
+    quality = QualityController(tracker, target_fps=settings["target_fps"]) if settings["target_fps"] > 0 else None
+    detector = GestureDetector(settings=settings)
+    # Cooldowns and hold timers all run on capture_time (see command_state.py)
+    commands = CommandStateMachine(hold_duration_required=settings["hold_duration_required"])
+    # Optional session recording for offline replay: GESTURE_RECORD=session.jsonl
+    record_path = os.environ.get("GESTURE_RECORD")
+    recorder = SessionRecorder(record_path) if record_path else None
+    # Optional event bus: GESTURE_EVENT_BUS=tcp://127.0.0.1:8765 (or unix:///tmp/gestures.sock)
+    bus_address = os.environ.get("GESTURE_EVENT_BUS")
+    bus = None
+    if bus_address:
+        try:
+            bus = GestureEventBus(bus_address).start()
+        except RuntimeError as e:
+            print(f"[WARN] {e}; continuing without the event bus")
+    last_published_gesture = None
+    # Profiling hooks (see utils/profiling.py)
+    if profiler is None:
+        profiler = ProfilingHooks.from_env()
+        profiler.install_signal_handler()
     window_name = "Gesture-Controlled Presentation"
-    cv2.namedWindow(window_name, cv2.WINDOW_NORMAL)
-    cv2.resizeWindow(window_name, 1280, 720)
+    opencv_preview = frame_slot is None and not headless
+    if opencv_preview:
+        cv2.namedWindow(window_name, cv2.WINDOW_NORMAL)
+        cv2.resizeWindow(window_name, 1280, 720)
     feedback_flash = 0  # Frames of screen flash remaining
 
-    while True:
+    while frame_slot is None or not frame_slot.stop_event.is_set():
         ret, frame = cap.read()
+        capture_time = time.monotonic()
         if not ret:
             break
+        if profiler.active:
+            profiler.on_frame()
 
-        annotated_frame, landmarks_list = tracker.process_frame(frame)
+        annotated_frame, landmarks_list = tracker.process_frame(frame, timestamp=capture_time)
+        if quality is not None:
+            quality.update()
+        if recorder is not None:
+            recorder.write(capture_time, landmarks_list)
         h, w = annotated_frame.shape[:2]
-
-        # Command Mode banner
-        if command_mode:
-            cv2.rectangle(annotated_frame, (0, 0), (w, 45), (0, 220, 0), -1)
-            cv2.putText(annotated_frame, "COMMAND MODE: ON", (20, 35),
-                        cv2.FONT_HERSHEY_SIMPLEX, 1, (25, 25, 25), 2)
-        else:
-            cv2.rectangle(annotated_frame, (0, 0), (w, 45), (30, 30, 30), -1)
-            cv2.putText(annotated_frame,
-                        "COMMAND MODE: OFF (Show Open Palm to activate)",
-                        (20, 35), cv2.FONT_HERSHEY_SIMPLEX, 0.78, (200, 200, 200), 2)
+        overlay = OverlayState(commands.command_mode)
 
         if landmarks_list:
             for idx, landmarks in enumerate(landmarks_list):
-                gesture = detector.detect_gesture(landmarks)
-                now = time.time()
-                # Command Mode toggling
-                if gesture == "Open Palm" and not command_mode and now - last_command_time > mode_cooldown:
-                    command_mode = True
-                    last_command_time = now
-                    cv2.putText(annotated_frame, ">>> COMMAND MODE ON <<<", (40, 60),
-                                cv2.FONT_HERSHEY_SIMPLEX, 1.15, (0, 255, 0), 3)
-                    gesture_active = None
-                    gesture_start_time = 0
+                gesture = detector.detect_gesture(landmarks, capture_time)
+                if bus is not None and gesture != last_published_gesture:
+                    if gesture:
+                        bus.publish_gesture(gesture)
+                    last_published_gesture = gesture
+                step = commands.update(gesture, capture_time)
+
+                if step.event == MODE_ON:
+                    overlay.message = (">>> COMMAND MODE ON <<<", (0, 255, 0))
                     continue
-                if command_mode and gesture == "Fist" and now - last_command_time > mode_cooldown:
-                    command_mode = False
-                    last_command_time = now
-                    cv2.putText(annotated_frame, ">>> COMMAND MODE OFF <<<", (40, 60),
-                                cv2.FONT_HERSHEY_SIMPLEX, 1.15, (0, 0, 255), 3)
-                    gesture_active = None
-                    gesture_start_time = 0
+                if step.event == MODE_OFF:
+                    overlay.message = (">>> COMMAND MODE OFF <<<", (0, 0, 255))
+                    continue
+                if not commands.command_mode:
                     continue
 
-                if command_mode:
-                    wrist_x = int(landmarks[0][0] * w)
-                    wrist_y = int(landmarks[0][1] * h)
-                    # Instant Zoom In/Out
-                    if gesture in ("Zoom In", "Zoom Out") and now - last_zoom_time > zoom_cooldown:
-                        cv2.putText(annotated_frame, f"{gesture} triggered!",
-                                    (wrist_x - 30, wrist_y + 60 + 40 * idx),
-                                    cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 200, 0), 2)
-                        if gesture == "Zoom In":
-                            zoom_in()
-                        else:
-                            zoom_out()
-                        last_zoom_time = now
-                        cv2.putText(annotated_frame, gesture,
-                                    (wrist_x - 30, wrist_y + 30 + 40 * idx),
-                                    cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
-                        play_feedback_sound()   # Play sound here!
-                        feedback_flash = 10
-                        continue
-
-                    hold_gestures = (
-                        "fingers_swipe_left", "fingers_swipe_right",
-                        "fingers_scroll_up", "fingers_scroll_down",
-                        "OK Sign", "Three Fingers", "Palm Left", "Palm Right",
-                        "Peace", "Thumbs Up", "Four Fingers",
-                        "L Gesture", "Single Point", "C Shape", "Rock Sign"
-                    )
-                    if gesture in hold_gestures:
-                        if gesture != gesture_active:
-                            gesture_active = gesture
-                            gesture_start_time = now
-                        else:
-                            elapsed = now - gesture_start_time
-                            progress = min(int((elapsed / hold_duration_required) * 200), 200)
-                            cv2.rectangle(annotated_frame, (w - 220, h - 50),
-                                          (w - 220 + progress, h - 25), (80, 255, 80), -1)
-                            cv2.rectangle(annotated_frame, (w - 220, h - 50),
-                                          (w - 20, h - 25), (60, 100, 60), 2)
-                            cv2.putText(annotated_frame, "Hold for Action",
-                                        (w - 200, h - 60), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (200, 255, 200), 2)
-                            if elapsed >= hold_duration_required:
-                                if gesture == "fingers_swipe_right":
-                                    next_slide()
-                                elif gesture == "fingers_swipe_left":
-                                    previous_slide()
-                                elif gesture == "OK Sign":
-                                    pointer_toggle()
-                                elif gesture == "Three Fingers":
-                                    start_slideshow()
-                                elif gesture == "Palm Left":
-                                    previous_slide()
-                                elif gesture == "Palm Right":
-                                    next_slide()
-                                elif gesture == "Peace":
-                                    pointer_toggle()
-                                elif gesture == "Thumbs Up":
-                                    start_slideshow()
-                                elif gesture == "Four Fingers":
-                                    stop_slideshow()
-                                elif gesture == "fingers_scroll_up":
-                                    scroll_up(amount=5)
-                                elif gesture == "fingers_scroll_down":
-                                    scroll_down(amount=5)
-                                elif gesture == "L Gesture":
-                                    pointer_toggle()
-                                elif gesture == "Single Point":
-                                    pointer_toggle()
-                                elif gesture == "C Shape":
-                                    pointer_toggle()
-                                elif gesture == "Rock Sign":
-                                    next_slide()
-                                cv2.putText(annotated_frame, f"{gesture} triggered!",
-                                            (wrist_x - 30, wrist_y + 60 + 40 * idx),
-                                            cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 200, 0), 2)
-                                play_feedback_sound()   # Make sure to play sound on each action!
-                                feedback_flash = 10
-                                time.sleep(0.2)
-                                gesture_active = None
-                                gesture_start_time = 0
-                    else:
-                        gesture_active = None
-                        gesture_start_time = 0
+                wrist_x = int(landmarks[0][0] * w)
+                wrist_y = int(landmarks[0][1] * h)
+                if step.hold_progress is not None:
+                    overlay.hold_progress = step.hold_progress
+                if step.action:
+                    perform_action(step.action)
+                    if bus is not None:
+                        bus.publish_action(gesture, step.action)
+                    overlay.add_label(f"{gesture} triggered!", wrist_x - 30, wrist_y + 60 + 40 * idx, (0, 200, 0))
+                    play_feedback_sound()   # Make sure to play sound on each action!
+                    feedback_flash = 10
 
-                    # Display detected gesture
-                    if gesture:
-                        if "Palm" in gesture:
-                            color = (0, 120, 255)
-                        elif "OK" in gesture:
-                            color = (100, 50, 245)
-                        elif "fingers" in gesture or "Finger" in gesture:
-                            color = (120, 220, 250)
-                        elif gesture in ("L Gesture", "Single Point", "C Shape", "Rock Sign"):
-                            color = (255, 140, 0)
-                        else:
-                            color = (0, 255, 0)
-                        cv2.putText(annotated_frame, gesture,
-                                    (wrist_x - 30, wrist_y + 30 + 40 * idx),
-                                    cv2.FONT_HERSHEY_SIMPLEX, 1, color, 2)
-                else:
-                    gesture_active = None
-                    gesture_start_time = 0
+                # Display detected gesture
+                if gesture:
+                    overlay.add_label(gesture, wrist_x - 30, wrist_y + 30 + 40 * idx, gesture_color(gesture))
 
-        # Draw border flash for feedback
+        # Border flash for feedback
         if feedback_flash > 0:
-            cv2.rectangle(annotated_frame, (0, 0), (w-1, h-1), (0, 255, 0), thickness=18)
+            overlay.flash = True
             feedback_flash -= 1
 
+        if frame_slot is not None:
+            # Qt window paints the overlay itself; the frame is not touched after this
+            frame_slot.publish(annotated_frame, overlay)
+            for key in frame_slot.take_keys():
+                profiler.on_key(key)
+            continue
+        if headless:
+            continue
+        draw_overlay_cv2(annotated_frame, overlay)
         cv2.imshow(window_name, annotated_frame)
-        if cv2.waitKey(1) & 0xFF == ord('q'):
+        key = cv2.waitKey(1) & 0xFF
+        if key == ord('q'):
             break
+        profiler.on_key(key)
 
     cap.release()
-    cv2.destroyAllWindows()
+    if opencv_preview:
+        cv2.destroyAllWindows()
+    profiler.close()
+    if recorder is not None:
+        recorder.close()
+    if bus is not None:
+        bus.stop()
+
+
+def main():
+    # Load user/calibrated gesture settings
+    settings = load_gesture_settings()
+    # Signal handlers can only be installed on the main thread, and with the Qt
+    # window the pipeline runs on a worker thread
+    profiler = ProfilingHooks.from_env()
+    profiler.install_signal_handler()
+    # GESTURE_HEADLESS=1: no preview; GESTURE_UI=opencv: old cv2.imshow preview; default: Qt window
+    if os.environ.get("GESTURE_HEADLESS") == "1":
+        run_pipeline(settings, headless=True, profiler=profiler)
+        return
+    if os.environ.get("GESTURE_UI", "qt") == "qt":
+        try:
+            from ui.main_window import run_qt_window
+        except ImportError as e:
+            print(f"[WARN] Qt window unavailable ({e}), falling back to OpenCV preview")
+        else:
+            run_qt_window(lambda slot: run_pipeline(settings, frame_slot=slot, profiler=profiler))
+            return
+    run_pipeline(settings, profiler=profiler)
 
 if __name__ == "__main__":
     main()
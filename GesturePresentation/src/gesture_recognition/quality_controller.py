@@ -0,0 +1,162 @@
+#quality_controller.py
+#Closed-loop quality controller for HandTracker
+
+"""
+Keeps the hand tracker inside an FPS budget by moving along a ladder of
+quality levels (model_complexity, input width, max_num_hands), best first.
+
+- Watches HandTracker.last_inference_time (smoothed with an EMA)
+- Steps down quickly when inference is over budget, steps up slowly when
+  there is plenty of headroom (asymmetric counts + dwell time = hysteresis)
+- Remembers the last smoothed inference time measured on every level. A
+  level that was over budget is only retried after a wait that doubles
+  (without limit) every time it fails again, so it does not flap between
+  two neighbouring levels
+- Every transition is printed and kept in `transitions`
+"""
+
+import time
+
+# Fraction of the frame period inference may use; the rest is left for
+# gesture detection, drawing and display.
+INFERENCE_BUDGET_FRACTION = 0.7
+
+
+def build_quality_levels(max_num_hands=2):
+    """
+    Quality ladder, best first: (model_complexity, input_width, max_num_hands).
+    input_width None means full camera resolution.
+
+    MediaPipe resizes every frame to its fixed model inputs (192x192 palm
+    detection, 224x224 landmarks), so input_width only saves that internal
+    resize and copy; the rungs that cut inference are model_complexity and
+    max_num_hands. A single reduced-width rung is kept as the last resort.
+    """
+    levels = [
+        (1, None, max_num_hands),
+        (0, None, max_num_hands),
+        (0, None, 1),
+        (0, 320, 1),
+    ]
+    unique = []
+    for level in levels:
+        if level not in unique:
+            unique.append(level)
+    return unique
+
+
+def describe_level(level):
+    complexity, width, hands = level
+    return f"complexity={complexity} width={width or 'full'} hands={hands}"
+
+
+class QualityController:
+    def __init__(
+        self,
+        tracker,
+        target_fps=20,
+        levels=None,
+        ema_alpha=0.1,          # smoothing of the measured inference time
+        downgrade_after=15,     # consecutive over-budget frames before stepping down
+        upgrade_after=90,       # consecutive frames with headroom before stepping up
+        upgrade_headroom=0.6,   # "headroom" = smoothed time below this fraction of the budget
+        min_dwell=2.0,          # seconds to stay on a level before any further change
+        warmup_frames=10,       # frames ignored after a change (graph rebuild, re-detection)
+        stable_after=60.0,      # seconds on a level after which an old failure is forgotten
+        clock=time.monotonic
+    ):
+        self.tracker = tracker
+        self.target_fps = target_fps
+        self.budget = INFERENCE_BUDGET_FRACTION / target_fps
+        self.levels = levels or build_quality_levels(tracker.max_num_hands)
+        self.ema_alpha = ema_alpha
+        self.downgrade_after = downgrade_after
+        self.upgrade_after = upgrade_after
+        self.upgrade_headroom = upgrade_headroom
+        self.min_dwell = min_dwell
+        self.warmup_frames = warmup_frames
+        self.stable_after = stable_after
+        self.clock = clock
+
+        self.level = 0
+        self.transitions = []  # (time, old_level, new_level, smoothed_inference_time)
+        self.level_costs = [None] * len(self.levels)  # last smoothed inference time per level
+        self._failures = [0] * len(self.levels)       # times each level had to be abandoned
+        self._reset_measurements()
+        self._apply(self.level)
+
+    def _reset_measurements(self):
+        self.smoothed = None
+        self._over = 0
+        self._under = 0
+        self._warmup = self.warmup_frames
+        self._level_since = self.clock()
+
+    def _apply(self, index):
+        complexity, width, hands = self.levels[index]
+        self.tracker.reconfigure(model_complexity=complexity, input_width=width, max_num_hands=hands)
+
+    def update(self, inference_time=None):
+        """
+        Feed one frame's inference time (defaults to the tracker's last
+        measurement). Returns True if the quality level changed.
+        """
+        if inference_time is None:
+            inference_time = self.tracker.last_inference_time
+        if self._warmup > 0:
+            self._warmup -= 1
+            return False
+
+        if self.smoothed is None:
+            self.smoothed = inference_time
+        else:
+            self.smoothed += self.ema_alpha * (inference_time - self.smoothed)
+        self.level_costs[self.level] = self.smoothed
+
+        if self.smoothed > self.budget:
+            self._over += 1
+            self._under = 0
+        elif self.smoothed < self.budget * self.upgrade_headroom:
+            self._under += 1
+            self._over = 0
+        else:
+            self._over = 0
+            self._under = 0
+
+        now = self.clock()
+        if now - self._level_since < self.min_dwell:
+            return False
+        if self._over >= self.downgrade_after and self.level < len(self.levels) - 1:
+            if now - self._level_since < self.stable_after:
+                self._failures[self.level] += 1
+            else:
+                # Held for a long time; the load changed, the level is not too slow per se
+                self._failures[self.level] = 1
+            self._change(self.level + 1, now)
+            return True
+        if self.level > 0 and self._under >= self._upgrade_wait(self.level - 1):
+            self._change(self.level - 1, now)
+            return True
+        return False
+
+    def _upgrade_wait(self, index):
+        """
+        Frames of headroom needed before stepping up to `index`. A level last
+        measured over budget has to wait twice as long after every failure.
+        """
+        cost = self.level_costs[index]
+        if cost is None or cost <= self.budget:
+            return self.upgrade_after
+        return self.upgrade_after * 2 ** self._failures[index]
+
+    def _change(self, new_level, now):
+        old_level = self.level
+        self.transitions.append((now, old_level, new_level, self.smoothed))
+        direction = "down" if new_level > old_level else "up"
+        print(f"[INFO] Quality {direction}: {describe_level(self.levels[old_level])} -> "
+              f"{describe_level(self.levels[new_level])} "
+              f"(inference {self.smoothed * 1e3:.1f} ms, budget {self.budget * 1e3:.1f} ms "
+              f"for {self.target_fps:g} fps)")
+        self.level = new_level
+        self._apply(new_level)
+        self._reset_measurements()
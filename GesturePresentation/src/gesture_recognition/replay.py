@@ -0,0 +1,129 @@
+#replay.py
+#Record landmark sessions and replay them through GestureDetector + CommandStateMachine
+
+"""
+Set GESTURE_RECORD=session.jsonl when running main.py to record the
+smoothed landmarks of every frame together with its capture timestamp.
+Replaying feeds them through the same detector and command state machine
+with those timestamps, so the actions (and the frames they fire on) do not
+depend on how fast the replay runs:
+
+    python -m gesture_recognition.replay session.jsonl              # as fast as possible
+    python -m gesture_recognition.replay session.jsonl --speed 1    # real time
+    python -m gesture_recognition.replay session.jsonl --set swipe_horizontal_threshold=0.07
+    python -m gesture_recognition.replay --synthetic 120 demo.jsonl # record a synthetic session
+
+Each line of a session file is {"t": seconds, "hands": [[[x, y, z] * 21], ...]}.
+"""
+
+import json
+import sys
+import time
+from collections import Counter
+
+import numpy as np
+
+from gesture_recognition.command_state import CommandStateMachine
+from gesture_recognition.gesture_detector import GestureDetector, load_gesture_settings
+
+
+class SessionRecorder:
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "w")
+        print(f"[INFO] Recording landmarks to {path}")
+
+    def write(self, t, landmarks_list):
+        hands = [np.asarray(landmarks).tolist() for landmarks in landmarks_list or ()]
+        self._file.write(json.dumps({"t": t, "hands": hands}) + "\n")
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+def read_session(path):
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                frame = json.loads(line)
+                yield frame["t"], [np.asarray(hand) for hand in frame["hands"]]
+
+
+def replay(frames, settings=None, speed=0.0, sleep=time.sleep, clock=time.monotonic):
+    """
+    Run (t, hands) frames through a fresh detector and state machine.
+    settings: thresholds / cooldowns overriding the calibration file.
+    speed: 0 replays as fast as possible, otherwise paces frames at
+    `speed` times real time. Returns [(t, gesture, event, action)] for
+    every frame where the state machine did something.
+    """
+    settings = {**load_gesture_settings(), **(settings or {})}
+    detector = GestureDetector(settings=settings)
+    commands = CommandStateMachine(hold_duration_required=settings["hold_duration_required"])
+    events = []
+    start_t = start_wall = None
+    for t, hands in frames:
+        if speed > 0:
+            if start_t is None:
+                start_t, start_wall = t, clock()
+            delay = (t - start_t) / speed - (clock() - start_wall)
+            if delay > 0:
+                sleep(delay)
+        for landmarks in hands:
+            gesture = detector.detect_gesture(landmarks, t)
+            step = commands.update(gesture, t)
+            if step.event:
+                events.append((t, gesture, step.event, step.action))
+    return events
+
+
+def record_synthetic(path, seconds, fps=30, seed=0):
+    from gesture_recognition.synthetic import SyntheticStream
+    stream = SyntheticStream(fps=fps, seed=seed)
+    recorder = SessionRecorder(path)
+    try:
+        while stream.t < seconds:
+            for t, hands, _ in stream.scenario():
+                recorder.write(t, hands)
+                if t >= seconds:
+                    break
+    finally:
+        recorder.close()
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Replay a recorded landmark session")
+    parser.add_argument("session", help="session file (JSON lines)")
+    parser.add_argument("--speed", type=float, default=0.0, help="replay speed vs real time (0 = unpaced)")
+    parser.add_argument("--synthetic", type=float, metavar="SECONDS",
+                        help="write a synthetic session of this length to SESSION and exit")
+    parser.add_argument("--set", action="append", default=[], metavar="KEY=VALUE",
+                        help="override a gesture setting for this replay (repeatable)")
+    parser.add_argument("--quiet", action="store_true", help="only print the summary")
+    args = parser.parse_args(argv)
+
+    if args.synthetic:
+        record_synthetic(args.session, args.synthetic)
+        return 0
+
+    overrides = {}
+    for item in args.set:
+        key, _, value = item.partition("=")
+        overrides[key] = json.loads(value)
+
+    wall_start = time.perf_counter()
+    events = replay(read_session(args.session), settings=overrides, speed=args.speed)
+    wall = time.perf_counter() - wall_start
+    if not args.quiet:
+        for t, gesture, event, action in events:
+            print(f"{t:10.3f}  {event:<8} {gesture:<22} {action or ''}")
+    actions = Counter(action for _, _, _, action in events if action)
+    print(f"\n{len(events)} events in {wall:.2f} s wall time")
+    print("Actions:", dict(actions))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,7 +12,9 @@ DEFAULT_SETTINGS = {
     "scroll_vertical_threshold": 0.04,
     "finger_motion_cooldown": 0.8,
     "zoom_cooldown": 0.6,
-    "smoothing_window": 5
+    "smoothing_window": 5,
+    "smoothing_mode": "average",
+    "target_fps": 20
 }
 
 def load_settings():
@@ -48,6 +50,8 @@ class SettingsGUI:
         self.cooldown_var = tk.DoubleVar(value=self.settings["finger_motion_cooldown"])
         self.zoom_cooldown_var = tk.DoubleVar(value=self.settings["zoom_cooldown"])
         self.smooth_var = tk.IntVar(value=self.settings["smoothing_window"])
+        self.fps_var = tk.IntVar(value=self.settings["target_fps"])
+        self.smoothing_mode_var = tk.StringVar(value=self.settings["smoothing_mode"])
 
         pad = {'padx': 10, 'pady': 8}
 
@@ -75,7 +79,15 @@ class SettingsGUI:
         ttk.Scale(root, from_=1, to=15, orient='horizontal', variable=self.smooth_var, length=220).grid(row=5, column=1, **pad)
         ttk.Label(root, textvariable=self.smooth_var, width=4).grid(row=5, column=2)
 
-        ttk.Button(root, text="Save Settings", command=self.save).grid(row=6, column=0, columnspan=3, pady=(20, 10))
+        ttk.Label(root, text="Target FPS (0 = fixed quality):").grid(row=6, column=0, sticky='e', **pad)
+        ttk.Scale(root, from_=0, to=60, orient='horizontal', variable=self.fps_var, length=220).grid(row=6, column=1, **pad)
+        ttk.Label(root, textvariable=self.fps_var, width=4).grid(row=6, column=2)
+
+        ttk.Label(root, text="Landmark Smoothing Mode:").grid(row=7, column=0, sticky='e', **pad)
+        ttk.Combobox(root, textvariable=self.smoothing_mode_var, values=("average", "predictive"),
+                     state='readonly', width=12).grid(row=7, column=1, sticky='w', **pad)
+
+        ttk.Button(root, text="Save Settings", command=self.save).grid(row=8, column=0, columnspan=3, pady=(20, 10))
 
     def save(self):
         new_settings = {
@@ -85,6 +97,8 @@ class SettingsGUI:
             "finger_motion_cooldown": float(self.cooldown_var.get()),
             "zoom_cooldown": float(self.zoom_cooldown_var.get()),
             "smoothing_window": int(self.smooth_var.get()),
+            "smoothing_mode": self.smoothing_mode_var.get(),
+            "target_fps": int(self.fps_var.get()),
         }
         if save_settings(new_settings):
             messagebox.showinfo("Settings Saved", "Calibration/settings saved successfully.\nThey will be used at next program run.")
@@ -0,0 +1,252 @@
+#soak.py
+#Soak / stress harness: drives GestureDetector and action dispatch with synthetic streams
+
+"""
+Runs GestureDetector plus the gesture -> action dispatch path over hours of
+simulated time (as fast as the machine allows) and watches for drift.
+
+Per reporting window it prints throughput, per-frame latency percentiles
+(detection + dispatch, generation excluded) and traced Python memory. At
+the end it compares the last windows with the first ones and exits with
+status 1 if throughput, p95 latency or memory drifted beyond tolerance, or
+if any gesture was recognized in too few of its segments.
+
+Each hand slot gets its own detector and command state machine, as if each
+hand were tracked by its own single-hand pipeline (main.py runs max_num_hands=1).
+
+    python -m gesture_recognition.soak --hours 4 --fps 240
+    python -m gesture_recognition.soak --hours 1 --dropout 0.6 --second-hand --swap 0.3
+
+Actions go to a counting sink instead of pyautogui, so nothing is sent to
+the desktop.
+"""
+
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from itertools import permutations
+
+import numpy as np
+
+from gesture_recognition.command_state import CommandStateMachine
+from gesture_recognition.gesture_detector import GestureDetector
+from gesture_recognition.hand_features import WRIST
+from gesture_recognition.synthetic import SyntheticStream, NEUTRAL_POSE
+from utils.stats import percentile
+
+
+class CountingSink:
+    """
+    Stands in for presentation_control.control.perform_action.
+    """
+
+    def __init__(self):
+        self.counts = Counter()
+
+    def __call__(self, action):
+        self.counts[action] += 1
+
+
+def _median(values):
+    values = sorted(values)
+    return values[len(values) // 2] if values else float("nan")
+
+
+class SoakRun:
+    def __init__(
+        self,
+        stream,
+        hours=2.0,
+        window_minutes=10.0,      # simulated minutes per reporting window
+        trace_memory=True,
+        latency_tolerance=0.5,    # allowed relative p95 increase
+        throughput_tolerance=0.3, # allowed relative throughput drop
+        memory_tolerance=1 << 20,  # allowed traced-memory growth, bytes
+        min_detection_rate=0.6,    # per-gesture fraction of segments that must be recognized
+        max_num_hands=2
+    ):
+        self.stream = stream
+        self.duration = hours * 3600.0
+        self.window = window_minutes * 60.0
+        self.trace_memory = trace_memory
+        self.latency_tolerance = latency_tolerance
+        self.throughput_tolerance = throughput_tolerance
+        self.memory_tolerance = memory_tolerance
+        self.min_detection_rate = min_detection_rate
+
+        # One detector + state machine per hand slot, so an idle second hand
+        # cannot reset holds or pollute the motion buffers of the active one.
+        # Hands are matched to slots by wrist position, not by list order,
+        # which the tracker (and the synthetic stream) may swap.
+        self.detectors = [GestureDetector() for _ in range(max_num_hands)]
+        self._slot_wrists = [None] * max_num_hands
+        self.commands = [CommandStateMachine() for _ in range(max_num_hands)]
+        self.sink = CountingSink()
+        self.windows = []  # dicts with per-window stats
+        self.gesture_counts = Counter()
+        self.segments = Counter()      # label -> segments seen
+        self.segment_hits = Counter()  # label -> segments where the label was detected
+
+    # --- Dispatch path (command mode + hold-to-confirm, as in main.py) ---
+
+    def dispatch(self, slot, gesture, t):
+        step = self.commands[slot].update(gesture, t)
+        if step.action:
+            self.sink(step.action)
+
+    def assign_slots(self, hands):
+        """
+        [(slot, landmarks)] pairing each hand with the slot whose last wrist
+        position is nearest (unused slots cost a fixed 1.0).
+        """
+        def cost(slots):
+            total = 0.0
+            for slot, landmarks in zip(slots, hands):
+                last = self._slot_wrists[slot]
+                total += 1.0 if last is None else float(np.hypot(*(landmarks[WRIST][:2] - last)))
+            return total
+
+        best = min(permutations(range(len(self._slot_wrists)), len(hands)), key=cost)
+        for slot, landmarks in zip(best, hands):
+            self._slot_wrists[slot] = landmarks[WRIST][:2]
+        return list(zip(best, hands))
+
+    def frames(self):
+        while True:
+            yield from self.stream.scenario()
+
+    def run(self):
+        if self.trace_memory:
+            tracemalloc.start()
+        perf = time.perf_counter
+        window_end = self.window
+        latencies = []
+        frames = 0
+        wall_start = perf()
+        current_label, hit = None, False
+
+        print(f"Soak: {self.duration / 3600:g} h simulated at {self.stream.fps:g} fps, "
+              f"window {self.window / 60:g} min")
+        print(f"{'sim time':>9} {'frames':>9} {'fps':>9} {'p50 us':>8} {'p95 us':>8} {'p99 us':>8} "
+              f"{'max us':>9} {'mem KiB':>9}")
+
+        for t, hands, label in self.frames():
+            if label != current_label:
+                if current_label is not None:
+                    self.segments[current_label] += 1
+                    self.segment_hits[current_label] += hit
+                current_label, hit = label, False
+
+            start = perf()
+            for slot, landmarks in self.assign_slots(hands):
+                gesture = self.detectors[slot].detect_gesture(landmarks, t)
+                self.dispatch(slot, gesture, t)
+                if gesture:
+                    self.gesture_counts[gesture] += 1
+                    hit = hit or gesture == label
+            latencies.append(perf() - start)
+            frames += 1
+
+            if t >= window_end:
+                wall = perf()
+                self._close_window(t, frames, wall - wall_start, latencies)
+                latencies = []
+                frames = 0
+                wall_start = perf()
+                window_end += self.window
+                if t >= self.duration:
+                    break
+
+        if self.trace_memory:
+            tracemalloc.stop()
+        return self.report()
+
+    def _close_window(self, t, frames, wall, latencies):
+        latencies.sort()
+        stats = {
+            "t": t,
+            "frames": frames,
+            "fps": frames / wall if wall > 0 else float("inf"),
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+            "max": latencies[-1] if latencies else float("nan"),
+            "mem": tracemalloc.get_traced_memory()[0] if self.trace_memory else None,
+        }
+        self.windows.append(stats)
+        mem = f"{stats['mem'] / 1024:9.1f}" if stats["mem"] is not None else f"{'n/a':>9}"
+        print(f"{t / 60:8.1f}m {frames:9d} {stats['fps']:9.0f} {stats['p50'] * 1e6:8.1f} "
+              f"{stats['p95'] * 1e6:8.1f} {stats['p99'] * 1e6:8.1f} {stats['max'] * 1e6:9.1f} {mem}")
+
+    # --- Drift check ---
+
+    def report(self):
+        print("\nActions dispatched:", dict(self.sink.counts))
+        print("Detection rate per gesture (segments where it was recognized):")
+        for label in sorted(self.segments):
+            print(f"    {label:<22} {self.segment_hits[label]:6d}/{self.segments[label]:<6d} "
+                  f"({100.0 * self.segment_hits[label] / self.segments[label]:.1f}%)")
+
+        failures = []
+        for label in sorted(self.segments):
+            rate = self.segment_hits[label] / self.segments[label]
+            if rate < self.min_detection_rate:
+                failures.append(f"{label} recognized in only {100.0 * rate:.1f}% of segments "
+                                f"(minimum {100.0 * self.min_detection_rate:.0f}%)")
+        if self.segments and not self.sink.counts:
+            failures.append("no actions were dispatched")
+        # The first window includes warm-up (imports, caches), so the baseline starts after it
+        usable = self.windows[1:] if len(self.windows) > 2 else self.windows
+        if len(usable) >= 2:
+            k = max(1, min(3, len(usable) // 3))
+            head, tail = usable[:k], usable[-k:]
+            base_p95, tail_p95 = _median([w["p95"] for w in head]), _median([w["p95"] for w in tail])
+            base_fps, tail_fps = _median([w["fps"] for w in head]), _median([w["fps"] for w in tail])
+            if tail_p95 > base_p95 * (1.0 + self.latency_tolerance):
+                failures.append(f"p95 latency drifted {base_p95 * 1e6:.1f} -> {tail_p95 * 1e6:.1f} us")
+            if tail_fps < base_fps * (1.0 - self.throughput_tolerance):
+                failures.append(f"throughput drifted {base_fps:.0f} -> {tail_fps:.0f} frames/s")
+            if self.trace_memory:
+                growth = _median([w["mem"] for w in tail]) - _median([w["mem"] for w in head])
+                if growth > self.memory_tolerance:
+                    failures.append(f"memory grew by {growth / 1024:.1f} KiB")
+        else:
+            print("[WARN] Too few windows to check for drift; run longer or shorten --window")
+
+        if failures:
+            for failure in failures:
+                print(f"[FAIL] {failure}")
+            return False
+        print("[OK] No drift in throughput, latency or memory; detection rates above "
+              f"{100.0 * self.min_detection_rate:.0f}%")
+        return True
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Soak test GestureDetector with synthetic landmark streams")
+    parser.add_argument("--hours", type=float, default=2.0, help="simulated hours")
+    parser.add_argument("--fps", type=float, default=120.0, help="simulated camera frame rate")
+    parser.add_argument("--window", type=float, default=10.0, help="simulated minutes per report window")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--jitter", type=float, default=0.002)
+    parser.add_argument("--dropout", type=float, default=0.0, help="single-frame hand losses per simulated second")
+    parser.add_argument("--second-hand", action="store_true", help="keep an idle second hand in view")
+    parser.add_argument("--swap", type=float, default=0.0, help="hand order swaps per simulated second (each lasts until the next)")
+    parser.add_argument("--min-rate", type=float, default=0.6,
+                        help="fail if any gesture is recognized in fewer than this fraction of its segments")
+    parser.add_argument("--no-tracemalloc", action="store_true", help="skip memory tracking (lower overhead)")
+    args = parser.parse_args(argv)
+
+    stream = SyntheticStream(
+        fps=args.fps, seed=args.seed, jitter=args.jitter, dropout_rate=args.dropout,
+        second_hand=NEUTRAL_POSE if args.second_hand else None, hand_swap_rate=args.swap
+    )
+    ok = SoakRun(stream, hours=args.hours, window_minutes=args.window,
+                 trace_memory=not args.no_tracemalloc, min_detection_rate=args.min_rate).run()
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,246 @@
+#synthetic.py
+#Synthetic hand-landmark streams for soak / stress testing
+
+"""
+Generates (21, 3) landmark arrays in the same normalized image coordinates
+HandTracker produces (x right, y down, after the mirror flip), so they can be
+fed straight into GestureDetector.
+
+Poses are built from finger states (extended / curled) and a thumb placement,
+chosen to hit GestureDetector's rules in its priority order; they are
+detector-space poses, not anatomical references.
+
+A stream is a sequence of frames (t, hands, label):
+    t      simulated timestamp in seconds
+    hands  list of (21, 3) arrays, like HandTracker.process_frame() returns
+           (empty on a dropout, two entries when a second hand is in view)
+    label  the gesture the segment is meant to produce, or None
+
+    stream = SyntheticStream(fps=240, seed=1, jitter=0.002)
+    for t, hands, label in stream.static("Peace", 1.0):
+        ...
+"""
+
+import numpy as np
+
+# --- Hand model (wrist at origin, fingers pointing up, thumb on the left) ---
+
+_FINGER_MCP = {  # index, middle, ring, pinky MCP offsets from the wrist
+    1: (-0.035, -0.09),
+    2: (-0.010, -0.095),
+    3: (0.015, -0.09),
+    4: (0.038, -0.08),
+}
+_EXTENDED_SEGMENTS = ((0.0, -0.04), (0.0, -0.03), (0.0, -0.025))  # MCP->PIP->DIP->TIP
+_CURLED_SEGMENTS = ((0.0, -0.03), (0.0, 0.02), (0.0, 0.02))
+
+_THUMB_BASE = ((-0.03, -0.02), (-0.06, -0.04))  # CMC, MCP
+_THUMB_PLACEMENTS = {  # IP, TIP
+    "out": ((-0.085, -0.06), (-0.12, -0.09)),       # extended away from the palm
+    "tucked": ((-0.05, -0.06), (-0.03, -0.07)),     # folded over the palm, near the wrist
+    "touch": ((-0.07, -0.07), (-0.045, -0.085)),    # tip resting on a curled index tip
+}
+
+# fingers: (index, middle, ring, pinky) extended?  thumb: placement
+POSES = {
+    "Open Palm":     {"fingers": (1, 1, 1, 1), "thumb": "out"},
+    "Fist":          {"fingers": (0, 0, 0, 0), "thumb": "tucked"},
+    "Thumbs Up":     {"fingers": (0, 0, 0, 0), "thumb": "out"},
+    "Peace":         {"fingers": (1, 1, 0, 0), "thumb": "tucked"},
+    "OK Sign":       {"fingers": (0, 1, 0, 0), "thumb": "touch"},
+    "Palm Left":     {"fingers": (0, 0, 0, 1), "thumb": "tucked", "tilt": -40.0},
+    "Palm Right":    {"fingers": (0, 0, 0, 1), "thumb": "tucked", "tilt": 40.0},
+    "Three Fingers": {"fingers": (1, 1, 1, 0), "thumb": "tucked"},
+    "Four Fingers":  {"fingers": (1, 1, 1, 1), "thumb": "tucked"},
+    "L Gesture":     {"fingers": (1, 0, 0, 0), "thumb": "out"},
+    "Single Point":  {"fingers": (1, 0, 0, 0), "thumb": "tucked"},
+    "C Shape":       {"fingers": (0, 0, 0, 1), "thumb": "out"},
+    "Rock Sign":     {"fingers": (1, 0, 0, 1), "thumb": "tucked"},
+}
+# No static rule claims this pose, so its frames reach the motion detector
+NEUTRAL_POSE = {"fingers": (0, 1, 1, 0), "thumb": "tucked"}
+
+STATIC_GESTURES = tuple(POSES)
+MOTION_GESTURES = ("fingers_swipe_right", "fingers_swipe_left", "fingers_scroll_up", "fingers_scroll_down")
+ZOOM_GESTURES = ("Zoom In", "Zoom Out")
+
+_PINCH_TIPS = np.array([4, 8, 12])  # tips whose spread drives detect_zoom
+MOTION_FRAMES = 8     # default length of a swipe
+PINCH_FRAMES = 4      # default length of a pinch / spread (detect_zoom looks at 5 samples)
+SETTLE_STEP = 0.002   # max per-frame movement when drifting back after a motion
+
+
+def make_pose(pose, center=(0.5, 0.75), scale=1.0, tilt=0.0):
+    """
+    Build a (21, 3) landmark array for a pose name from POSES or a pose dict.
+    `center` is the wrist position, `tilt` rotates the hand (degrees).
+    """
+    spec = POSES[pose] if isinstance(pose, str) else pose
+    tilt = spec.get("tilt", 0.0) + tilt
+
+    pts = np.zeros((21, 3))
+    pts[1, :2], pts[2, :2] = _THUMB_BASE
+    pts[3, :2], pts[4, :2] = _THUMB_PLACEMENTS[spec["thumb"]]
+    for finger, extended in enumerate(spec["fingers"], start=1):
+        base = 1 + 4 * finger  # 5, 9, 13, 17
+        pts[base, :2] = _FINGER_MCP[finger]
+        segments = _EXTENDED_SEGMENTS if extended else _CURLED_SEGMENTS
+        for j, step in enumerate(segments, start=1):
+            pts[base + j, :2] = pts[base + j - 1, :2] + step
+    # Depth: fingertips slightly closer to the camera than the palm, like MediaPipe's z
+    pts[:, 2] = -0.02 * np.abs(pts[:, 1]) / 0.2
+
+    if tilt:
+        a = np.radians(tilt)
+        rot = np.array([[np.cos(a), -np.sin(a)], [np.sin(a), np.cos(a)]])
+        pts[:, :2] = pts[:, :2] @ rot.T
+    pts[:, :2] *= scale
+    pts[:, :2] += center
+    return pts
+
+
+def _per_frame_probability(rate_per_second, dt):
+    return 1.0 - np.exp(-rate_per_second * dt) if rate_per_second else 0.0
+
+
+class SyntheticStream:
+    """
+    Frame generator. Every segment method yields (t, hands, label) and
+    advances the simulated clock by 1/fps per frame.
+    """
+
+    def __init__(
+        self,
+        fps=30,
+        seed=0,
+        jitter=0.002,            # std-dev of per-landmark gaussian noise
+        dropout_rate=0.0,        # single-frame hand losses per second (on average)
+        second_hand=None,        # pose of an extra idle hand in view, e.g. NEUTRAL_POSE
+        hand_swap_rate=0.0,      # swaps of the two hands' list order per second; each lasts until the next
+        center=(0.5, 0.75),
+        scale=1.0
+    ):
+        self.fps = fps
+        self.dt = 1.0 / fps
+        self.rng = np.random.default_rng(seed)
+        self.jitter = jitter
+        self.dropout_rate = dropout_rate
+        self.second_hand = second_hand
+        self.hand_swap_rate = hand_swap_rate
+        # Rates are per second, so a run means the same thing at any fps
+        self._dropout_p = _per_frame_probability(dropout_rate, self.dt)
+        self._swap_p = _per_frame_probability(hand_swap_rate, self.dt)
+        self._swapped = False
+        self.center = np.array(center, dtype=float)
+        self.scale = scale
+        self.t = 0.0
+        self._second = make_pose(second_hand, center=(0.2, 0.75)) if second_hand else None
+
+    def _frame(self, hand, label):
+        self.t += self.dt
+        if self._dropout_p and self.rng.random() < self._dropout_p:
+            return self.t, [], label
+        if self.jitter:
+            hand = hand + self.rng.normal(0.0, self.jitter, hand.shape)
+        hands = [hand]
+        if self._second is not None:
+            other = self._second + self.rng.normal(0.0, self.jitter, self._second.shape) if self.jitter else self._second
+            hands.append(other)
+            if self._swap_p and self.rng.random() < self._swap_p:
+                self._swapped = not self._swapped
+            if self._swapped:
+                hands.reverse()
+        return self.t, hands, label
+
+    def _frames(self, duration):
+        return max(1, int(round(duration * self.fps)))
+
+    # --- Segments ---
+
+    def static(self, pose, duration, label=None):
+        hand = make_pose(pose, center=self.center, scale=self.scale)
+        if label is None and isinstance(pose, str):
+            label = pose
+        for _ in range(self._frames(duration)):
+            yield self._frame(hand, label)
+
+    def neutral(self, duration):
+        return self.static(NEUTRAL_POSE, duration, label=None)
+
+    def dropout(self, duration):
+        for _ in range(self._frames(duration)):
+            self.t += self.dt
+            yield self.t, [], None
+
+    def swipe(self, direction, duration=None, distance=0.25):
+        """
+        Move the neutral hand right/left/up/down by `distance`, then drift back
+        to the start slowly enough not to register as the opposite swipe.
+        """
+        step = np.array({"right": (1, 0), "left": (-1, 0), "up": (0, -1), "down": (0, 1)}[direction], dtype=float)
+        label = {"right": "fingers_swipe_right", "left": "fingers_swipe_left",
+                 "up": "fingers_scroll_up", "down": "fingers_scroll_down"}[direction]
+        n = self._motion_frames(duration)
+        for i in range(1, n + 1):
+            center = self.center + step * distance * (i / n)
+            yield self._frame(make_pose(NEUTRAL_POSE, center=center, scale=self.scale), label)
+        back = self._settle_frames(distance)
+        for i in range(1, back + 1):
+            center = self.center + step * distance * (1.0 - i / back)
+            yield self._frame(make_pose(NEUTRAL_POSE, center=center, scale=self.scale), None)
+
+    def pinch(self, zoom_in, duration=None, factor=3.0):
+        """
+        Spread (zoom_in=True) or pinch the thumb, index and middle tips of the
+        neutral hand by `factor` around their centroid, then relax slowly.
+        """
+        label = "Zoom In" if zoom_in else "Zoom Out"
+        base = make_pose(NEUTRAL_POSE, center=self.center, scale=self.scale)
+        tips = base[_PINCH_TIPS, :2]
+        centroid = tips.mean(axis=0)
+        target = factor if zoom_in else 1.0 / factor
+
+        def frame_at(k):
+            hand = base.copy()
+            hand[_PINCH_TIPS, :2] = centroid + (tips - centroid) * k
+            return hand
+
+        n = self._motion_frames(duration, PINCH_FRAMES)
+        for i in range(1, n + 1):
+            yield self._frame(frame_at(1.0 + (target - 1.0) * i / n), label)
+        travel = float(np.abs(tips - centroid).max()) * abs(target - 1.0)
+        back = self._settle_frames(travel)
+        for i in range(1, back + 1):
+            yield self._frame(frame_at(target + (1.0 - target) * i / back), None)
+
+    def _motion_frames(self, duration, default=MOTION_FRAMES):
+        # GestureDetector's motion/zoom windows are counted in frames, so by
+        # default a motion spans a fixed number of frames whatever the frame
+        # rate; pass `duration` for physically timed motion instead.
+        return self._frames(duration) if duration else default
+
+    def _settle_frames(self, distance):
+        return max(1, int(np.ceil(distance / SETTLE_STEP)))
+
+    # --- Scenarios ---
+
+    def scenario(self, hold=1.0, gap=0.3):
+        """
+        One pass over everything the detector knows, in random order:
+        every static pose held for `hold`, every swipe/scroll and both zooms,
+        separated by neutral gaps and the occasional dropout.
+        """
+        segments = ([("static", g) for g in STATIC_GESTURES]
+                    + [("swipe", d) for d in ("right", "left", "up", "down")]
+                    + [("pinch", True), ("pinch", False)])
+        for i in self.rng.permutation(len(segments)):
+            kind, arg = segments[i]
+            if kind == "static":
+                yield from self.static(arg, hold)
+            elif kind == "swipe":
+                yield from self.swipe(arg)
+            else:
+                yield from self.pinch(arg)
+            yield from self.neutral(gap)
+            if self.rng.random() < 0.1:
+                yield from self.dropout(gap)
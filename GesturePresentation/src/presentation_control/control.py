@@ -138,3 +138,34 @@ def play_feedback_sound():
             except Exception as e:
                 print(f"[WARN] Could not play sound: {e}")
     threading.Thread(target=_play, daemon=True).start()
+
+# Action name -> function, used when dispatching by name (see gesture_map.py)
+ACTIONS = {
+    "next_slide": next_slide,
+    "previous_slide": previous_slide,
+    "start_slideshow": start_slideshow,
+    "stop_slideshow": stop_slideshow,
+    "zoom_in": zoom_in,
+    "zoom_out": zoom_out,
+    "pointer_toggle": pointer_toggle,
+    "fullscreen_toggle": fullscreen_toggle,
+    "black_screen": black_screen,
+    "white_screen": white_screen,
+    "scroll_up": scroll_up,
+    "scroll_down": scroll_down,
+    "mute_toggle": mute_toggle,
+    "laser_pointer_toggle": laser_pointer_toggle,
+    "annotation_toggle": annotation_toggle,
+    "next_section": next_section,
+    "previous_section": previous_section,
+}
+
+def perform_action(name):
+    """
+    Run the presentation action registered under `name`.
+    """
+    action = ACTIONS.get(name)
+    if action is None:
+        print(f"[WARN] Unknown action: {name}")
+        return
+    action()
@@ -0,0 +1,458 @@
+#event_bus.py
+#Asyncio gesture event bus with local socket subscribers
+
+"""
+Publishes gesture and action events (e.g. fingers_swipe_right -> next_slide)
+to any number of local subscribers: presentation host, speaker-notes screens,
+recording software, ...
+
+- Transport: TCP ("tcp://host:port") or Unix socket ("unix:///path/to.sock")
+- Wire format: one compact JSON object per line
+    {"seq":12,"type":"action","gesture":"fingers_swipe_right","action":"next_slide","t":8123.4567}
+  `t` is time.monotonic() taken when the event was published, so a subscriber
+  on the same machine can compute delivery latency as time.monotonic() - t.
+- The bus runs its own event loop in a background thread. publish() only
+  schedules the event on that loop, so the capture loop never waits on sockets.
+- Backpressure: each subscriber has a bounded queue. Events are only written
+  while the connection's send buffer is nearly empty, so a slow subscriber's
+  backlog stays in that queue, where the oldest events are dropped when it
+  is full and events older than `max_age` are dropped before sending (a
+  next_slide two seconds late is worse than none). Drops are counted and
+  visible as gaps in `seq`; other subscribers and the capture loop are
+  unaffected.
+
+Run a stand-in subscriber / fan-out latency benchmark:
+    python -m presentation_control.event_bus --listen tcp://127.0.0.1:8765
+    python -m presentation_control.event_bus --bench
+"""
+
+import asyncio
+import json
+import os
+import socket
+import sys
+import threading
+import time
+
+try:
+    import fcntl
+    import struct
+    import termios
+    _UNREAD_IOCTL = getattr(termios, "TIOCOUTQ", None)  # SIOCOUTQ on Linux
+except ImportError:  # Windows
+    _UNREAD_IOCTL = None
+
+from utils.stats import percentile
+
+DEFAULT_BUS_ADDRESS = "tcp://127.0.0.1:8765"
+SUBSCRIBER_QUEUE_SIZE = 64  # events buffered per subscriber before dropping oldest
+SUBSCRIBER_MAX_AGE = 0.5  # seconds; older events are dropped instead of sent
+SUBSCRIBER_SEND_BUFFER = 4096  # kernel send buffer (Linux doubles it); keeps the backlog in our queue
+SUBSCRIBER_WRITE_BUFFER = 1024  # only write while less than this is waiting in the transport
+MAX_EVENT_SIZE = 64 * 1024  # longest event line a subscriber accepts
+
+
+def _unread_bytes(sock):
+    """
+    Bytes written to a Unix stream socket that the peer has not read yet.
+    """
+    return struct.unpack("i", fcntl.ioctl(sock.fileno(), _UNREAD_IOCTL, b"\0\0\0\0"))[0]
+
+
+async def _wait_unread_below(sock, limit, poll=0.005):
+    while _unread_bytes(sock) >= limit:
+        await asyncio.sleep(poll)
+
+
+def parse_address(address):
+    """
+    Split a bus address into ("tcp", host, port) or ("unix", path, None).
+    """
+    if address.startswith("unix://"):
+        return "unix", address[len("unix://"):], None
+    if address.startswith("tcp://"):
+        address = address[len("tcp://"):]
+    host, _, port = address.rpartition(":")
+    return "tcp", host or "127.0.0.1", int(port)
+
+
+def encode_event(event):
+    return json.dumps(event, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def decode_event(line):
+    return json.loads(line)
+
+
+class _Subscriber:
+    __slots__ = ("queue", "dropped", "peer", "writer", "handler")
+
+    def __init__(self, queue_size, peer, writer, handler):
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+        self.peer = peer
+        self.writer = writer
+        self.handler = handler
+
+
+class GestureEventBus:
+    """
+    Fan-out publisher for gesture/action events over a local socket.
+    """
+
+    def __init__(self, address=DEFAULT_BUS_ADDRESS, queue_size=SUBSCRIBER_QUEUE_SIZE,
+                 max_age=SUBSCRIBER_MAX_AGE):
+        self.address = address
+        self.queue_size = queue_size
+        self.max_age = max_age
+        self._loop = None
+        self._thread = None
+        self._server = None
+        self._ready = threading.Event()
+        self._subscribers = set()
+        self._handlers = set()
+        self._seq = 0
+        self.published = 0
+        self.dropped = 0
+
+    # --- Lifecycle ---
+
+    def start(self):
+        """
+        Start the bus loop in a daemon thread and wait until it is listening.
+        """
+        if self._thread is not None:
+            return self
+        self._thread = threading.Thread(target=self._run, name="gesture-event-bus", daemon=True)
+        self._thread.start()
+        self._ready.wait(timeout=5)
+        if self._server is None:
+            self._thread.join(timeout=1)
+            self._thread = None  # so a later start() tries again
+            self._ready.clear()
+            raise RuntimeError(f"Event bus failed to start on {self.address}")
+        print(f"[INFO] Gesture event bus listening on {self.address}")
+        return self
+
+    def stop(self):
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop = None
+        self._thread = None
+        self._ready.clear()
+
+    @property
+    def subscriber_count(self):
+        return len(self._subscribers)
+
+    # --- Publishing (safe to call from any thread) ---
+
+    def publish(self, event_type, gesture=None, action=None, **extra):
+        """
+        Queue an event for every subscriber. Never blocks the caller.
+        """
+        if self._loop is None:
+            return
+        event = {"type": event_type, "gesture": gesture, "action": action, "t": time.monotonic()}
+        if extra:
+            event.update(extra)
+        self._loop.call_soon_threadsafe(self._fan_out, event)
+
+    def publish_gesture(self, gesture):
+        self.publish("gesture", gesture=gesture)
+
+    def publish_action(self, gesture, action):
+        self.publish("action", gesture=gesture, action=action)
+
+    # --- Loop side ---
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(self._serve())
+        except Exception as e:
+            print(f"[ERROR] Event bus could not listen on {self.address}: {e}")
+            self._ready.set()
+            self._loop.close()
+            self._loop = None
+            return
+        self._ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    async def _serve(self):
+        kind, host_or_path, port = parse_address(self.address)
+        if kind == "unix":
+            if os.path.exists(host_or_path):
+                os.unlink(host_or_path)
+            self._server = await asyncio.start_unix_server(self._handle_client, path=host_or_path)
+        else:
+            self._server = await asyncio.start_server(self._handle_client, host_or_path, port)
+
+    async def _shutdown(self):
+        if self._server is not None:
+            self._server.close()
+        for sub in list(self._subscribers):
+            if sub.queue.full():
+                sub.queue.get_nowait()
+            sub.queue.put_nowait(None)  # tells the client writer to finish
+        if self._handlers:
+            _, pending = await asyncio.wait(list(self._handlers), timeout=2)
+            # Handlers still stuck in drain() (subscriber not reading): drop the
+            # connection and cancel them, so none outlives the loop
+            for sub in list(self._subscribers):
+                if sub.handler in pending:
+                    sub.writer.transport.abort()
+            for handler in pending:
+                handler.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+            self._server = None
+        kind, path, _ = parse_address(self.address)
+        if kind == "unix" and os.path.exists(path):
+            os.unlink(path)
+
+    def _fan_out(self, event):
+        self._seq += 1
+        event["seq"] = self._seq
+        item = (event["t"], encode_event(event))
+        self.published += 1
+        for sub in self._subscribers:
+            if sub.queue.full():
+                # Slow consumer: drop its oldest event rather than stall everyone
+                sub.queue.get_nowait()
+                self._count_drop(sub)
+            sub.queue.put_nowait(item)
+
+    def _count_drop(self, sub):
+        sub.dropped += 1
+        self.dropped += 1
+
+    def _fresh(self, sub, item):
+        """
+        False (and counted as dropped) if the event is too old to be worth sending.
+        """
+        if self.max_age is not None and time.monotonic() - item[0] > self.max_age:
+            self._count_drop(sub)
+            return False
+        return True
+
+    async def _handle_client(self, reader, writer):
+        peer = writer.get_extra_info("peername") or "unix"
+        handler = asyncio.current_task()
+        sub = _Subscriber(self.queue_size, peer, writer, handler)
+        self._subscribers.add(sub)
+        self._handlers.add(handler)
+        sock = writer.get_extra_info("socket")
+        unix_sock = None
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SUBSCRIBER_SEND_BUFFER)
+            if sock.family != socket.AF_UNIX and hasattr(socket, "TCP_NOTSENT_LOWAT"):
+                # Only accept more data once the kernel has sent what it has
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NOTSENT_LOWAT, 1)
+            elif sock.family == socket.AF_UNIX and _UNREAD_IOCTL is not None:
+                # Unix stream sockets ignore the reader's SO_RCVBUF; watch our send queue instead
+                unix_sock = sock
+        # drain() returns only once the transport buffer is empty again
+        writer.transport.set_write_buffer_limits(high=SUBSCRIBER_WRITE_BUFFER, low=0)
+        watcher = asyncio.ensure_future(reader.read())  # completes on client EOF
+        getter = None
+        try:
+            closing = False
+            while not closing:
+                getter = asyncio.ensure_future(sub.queue.get())
+                done, _ = await asyncio.wait({getter, watcher}, return_when=asyncio.FIRST_COMPLETED)
+                if getter not in done:
+                    break
+                item = getter.result()
+                # Coalesce queued events into one write, up to the write threshold
+                chunks, size = [], 0
+                while item is not None:
+                    if self._fresh(sub, item):
+                        chunks.append(item[1])
+                        size += len(item[1])
+                    if size >= SUBSCRIBER_WRITE_BUFFER or sub.queue.empty():
+                        break
+                    item = sub.queue.get_nowait()
+                closing = item is None  # sentinel from _shutdown()
+                if chunks:
+                    writer.write(b"".join(chunks))
+                    # Anything published meanwhile waits in the bounded queue, not in socket buffers
+                    await writer.drain()
+                    if unix_sock is not None:
+                        await _wait_unread_below(unix_sock, SUBSCRIBER_WRITE_BUFFER)
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self._subscribers.discard(sub)
+            self._handlers.discard(handler)
+            pending = [task for task in (watcher, getter) if task is not None]
+            for task in pending:
+                task.cancel()
+            if sub.dropped:
+                print(f"[WARN] Subscriber {peer} dropped {sub.dropped} events (too slow)")
+            writer.close()
+            try:
+                await asyncio.gather(*pending, writer.wait_closed(), return_exceptions=True)
+            except asyncio.CancelledError:
+                pass
+
+
+# ------- Stand-in subscriber -------
+
+async def _connect(address, receive_buffer):
+    """
+    Non-blocking socket connected to the bus. The receive buffer has to be
+    sized before connecting: TCP never shrinks a window it has advertised.
+    """
+    kind, host_or_path, port = parse_address(address)
+    family = socket.AF_UNIX if kind == "unix" else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, receive_buffer)
+    sock.setblocking(False)
+    try:
+        await asyncio.get_running_loop().sock_connect(sock, host_or_path if kind == "unix" else (host_or_path, port))
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+
+async def subscribe(address, on_event, stop_event=None, receive_buffer=1024, max_event_size=MAX_EVENT_SIZE,
+                    max_age=SUBSCRIBER_MAX_AGE, on_receive=None):
+    """
+    Connect to a bus and call on_event(event, received_at) for every message.
+    A small receive_buffer keeps client-side buffering low, so a slow handler
+    pushes back on the bus instead of hiding behind a large local buffer;
+    max_event_size is only the longest line accepted.
+    Events that were already older than max_age on arrival (they waited in
+    socket buffers behind a slow handler) are skipped; returns how many.
+    on_receive(event, received_at), if given, sees every event before that filter.
+    """
+    loop = asyncio.get_running_loop()
+    sock = await _connect(address, receive_buffer)
+    stale = 0
+    partial = b""
+    try:
+        while stop_event is None or not stop_event.is_set():
+            data = await loop.sock_recv(sock, receive_buffer)
+            if not data:
+                break
+            *lines, partial = (partial + data).split(b"\n")
+            if len(partial) > max_event_size:
+                raise ValueError(f"Event longer than {max_event_size} bytes")
+            for line in lines:
+                event, received_at = decode_event(line), time.monotonic()
+                if on_receive is not None:
+                    on_receive(event, received_at)
+                if max_age is not None and received_at - event["t"] > max_age:
+                    stale += 1
+                    continue
+                result = on_event(event, received_at)
+                if asyncio.iscoroutine(result):
+                    await result
+    finally:
+        sock.close()
+    return stale
+
+
+async def _bench_fan_out(address, subscribers, slow_subscribers, rate, duration):
+    bus = GestureEventBus(address).start()
+    stats = [{"lat": [], "recv": 0, "gaps": 0, "last_seq": 0, "oldest": 0.0, "slow": i < slow_subscribers}
+             for i in range(subscribers)]
+    stop = asyncio.Event()
+
+    def make_handler(s):
+        async def handler(event, received_at):
+            s["lat"].append(received_at - event["t"])
+            if s["slow"]:
+                await asyncio.sleep(0.02)  # simulate a sluggish consumer
+        return handler
+
+    def make_counter(s):
+        # Sees every event before the max_age filter: gaps in seq are events the bus dropped
+        def counted(line_event, received_at):
+            s["recv"] += 1
+            s["gaps"] += line_event["seq"] - s["last_seq"] - 1
+            s["last_seq"] = line_event["seq"]
+            s["oldest"] = max(s["oldest"], received_at - line_event["t"])
+        return counted
+
+    tasks = [asyncio.ensure_future(subscribe(address, make_handler(s), stop, on_receive=make_counter(s)))
+             for s in stats]
+    while bus.subscriber_count < subscribers:
+        await asyncio.sleep(0.01)
+
+    # Publish from a plain thread, like the capture loop does
+    def publisher():
+        interval = 1.0 / rate
+        deadline = time.monotonic() + duration
+        next_t = time.monotonic()
+        while time.monotonic() < deadline:
+            bus.publish_action("fingers_swipe_right", "next_slide")
+            next_t += interval
+            delay = next_t - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+    await asyncio.get_running_loop().run_in_executor(None, publisher)
+    await asyncio.sleep(0.5)
+    stop.set()
+    bus.stop()
+    skipped = await asyncio.gather(*tasks, return_exceptions=True)
+
+    print(f"Published {bus.published} events at {rate}/s to {subscribers} subscribers "
+          f"({slow_subscribers} slow), bus dropped {bus.dropped} (full queue or older than "
+          f"{bus.max_age * 1e3:.0f} ms)")
+    print("  recv: events read, gaps: dropped by the bus, stale: read but older than max_age (skipped),")
+    print("  unsent: never reached the subscriber before the bus stopped; latency of handled events")
+    for i, (s, stale) in enumerate(zip(stats, skipped)):
+        lat = sorted(s["lat"])
+        stale = stale if isinstance(stale, int) else 0
+        unsent = bus.published - s["last_seq"]
+        print(f"  sub {i}{' (slow)' if s['slow'] else ''}: recv={s['recv']} gaps={s['gaps']} stale={stale} "
+              f"unsent={unsent} "
+              f"p50={percentile(lat, 50) * 1e3:.2f}ms p95={percentile(lat, 95) * 1e3:.2f}ms "
+              f"max={(lat[-1] if lat else float('nan')) * 1e3:.2f}ms oldest read={s['oldest'] * 1e3:.0f}ms")
+
+
+async def _print_events(address):
+    def show(event, received_at):
+        latency_ms = (received_at - event["t"]) * 1e3
+        print(f"[{event['seq']}] {event['type']}: {event.get('gesture')} -> {event.get('action')} "
+              f"({latency_ms:.2f} ms)")
+    await subscribe(address, show)
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Gesture event bus subscriber / fan-out benchmark")
+    parser.add_argument("--listen", metavar="ADDRESS", help="print events from a running bus")
+    parser.add_argument("--bench", action="store_true", help="measure fan-out latency under load")
+    parser.add_argument("--address", default="tcp://127.0.0.1:8799", help="bus address used by --bench")
+    parser.add_argument("--subscribers", type=int, default=8)
+    parser.add_argument("--slow", type=int, default=1, help="how many subscribers are slow consumers")
+    parser.add_argument("--rate", type=float, default=500.0, help="events per second")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds")
+    args = parser.parse_args(argv)
+
+    if args.listen:
+        asyncio.run(_print_events(args.listen))
+    elif args.bench:
+        asyncio.run(_bench_fan_out(args.address, args.subscribers, args.slow, args.rate, args.duration))
+    else:
+        parser.print_help()
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
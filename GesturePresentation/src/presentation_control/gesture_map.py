@@ -0,0 +1,30 @@
+# Gesture -> action name mapping
+# Kept free of pyautogui/cv2 imports so the event bus, tools and subscribers
+# can share the same names as the live control path.
+
+# Gestures that must be held for `hold_duration_required` before firing
+HOLD_GESTURE_ACTIONS = {
+    "fingers_swipe_right": "next_slide",
+    "fingers_swipe_left": "previous_slide",
+    "fingers_scroll_up": "scroll_up",
+    "fingers_scroll_down": "scroll_down",
+    "OK Sign": "pointer_toggle",
+    "Three Fingers": "start_slideshow",
+    "Palm Left": "previous_slide",
+    "Palm Right": "next_slide",
+    "Peace": "pointer_toggle",
+    "Thumbs Up": "start_slideshow",
+    "Four Fingers": "stop_slideshow",
+    "L Gesture": "pointer_toggle",
+    "Single Point": "pointer_toggle",
+    "C Shape": "pointer_toggle",
+    "Rock Sign": "next_slide",
+}
+
+# Gestures that fire immediately (still subject to their own cooldown)
+INSTANT_GESTURE_ACTIONS = {
+    "Zoom In": "zoom_in",
+    "Zoom Out": "zoom_out",
+}
+
+GESTURE_ACTIONS = {**HOLD_GESTURE_ACTIONS, **INSTANT_GESTURE_ACTIONS}
@@ -0,0 +1,282 @@
+#main_window.py
+#PyQt5 main window: zero-copy frame display with a render rate decoupled from the pipeline
+
+"""
+The capture / detection pipeline runs in a worker thread and hands its
+latest frame plus an OverlayState to the window through a FrameSlot. The
+window polls the slot on its own timer (capped at `max_fps`), so slow
+painting never holds up inference and frames the UI has no time for are
+simply skipped.
+
+Frames are wrapped in a QImage that points at the numpy buffer (no pixel
+copy); scaling happens inside QPainter.drawImage. The command-mode banner,
+hold progress bar, gesture labels and feedback flash are painted as vector
+shapes on top, in frame coordinates, instead of being drawn into the pixels.
+
+Runs under a virtual framebuffer or Qt's offscreen platform:
+    QT_QPA_PLATFORM=offscreen python -m ui.main_window --demo --frames 90 --snapshot window.png
+"""
+
+import sys
+import threading
+import time
+from collections import deque
+
+from PyQt5.QtCore import Qt, QTimer, QRectF
+from PyQt5.QtGui import QColor, QFont, QImage, QPainter, QPen
+from PyQt5.QtWidgets import QApplication, QLabel, QMainWindow, QWidget
+
+from ui.overlay import (
+    OverlayState, BANNER_HEIGHT, BANNER_ON_TEXT, BANNER_OFF_TEXT, HOLD_BAR_WIDTH, HOLD_TEXT
+)
+
+DEFAULT_MAX_FPS = 30
+
+
+def _qcolor(bgr):
+    b, g, r = bgr
+    return QColor(r, g, b)
+
+
+class FrameSlot:
+    """
+    Latest-frame handoff between the pipeline thread and the UI thread.
+    The pipeline must not modify a frame after publishing it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._frame = None
+        self._overlay = None
+        self.seq = 0
+        self.keys = deque()                  # key presses from the window, for the pipeline
+        self.stop_event = threading.Event()  # set when the window closes
+
+    def publish(self, frame, overlay):
+        with self._lock:
+            self._frame = frame
+            self._overlay = overlay
+            self.seq += 1
+
+    def latest(self):
+        with self._lock:
+            return self.seq, self._frame, self._overlay
+
+    def take_keys(self):
+        while self.keys:
+            yield self.keys.popleft()
+
+
+class VideoWidget(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.setMinimumSize(320, 180)
+        self._frame = None  # keeps the numpy buffer alive while the QImage points at it
+        self._image = None
+        self._overlay = OverlayState()
+        self._banner_font = QFont("Sans Serif")
+        self._banner_font.setPixelSize(26)
+        self._label_font = QFont("Sans Serif")
+        self._label_font.setPixelSize(26)
+        self._label_font.setBold(True)
+        self._small_font = QFont("Sans Serif")
+        self._small_font.setPixelSize(16)
+
+    def set_frame(self, frame, overlay):
+        h, w = frame.shape[:2]
+        self._frame = frame
+        self._image = QImage(frame.data, w, h, frame.strides[0], QImage.Format_BGR888)
+        self._overlay = overlay or OverlayState()
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), Qt.black)
+        if self._image is None:
+            return
+        # Letterbox the frame into the widget, then paint overlays in frame coordinates
+        fw, fh = self._image.width(), self._image.height()
+        scale = min(self.width() / fw, self.height() / fh)
+        target = QRectF((self.width() - fw * scale) / 2, (self.height() - fh * scale) / 2,
+                        fw * scale, fh * scale)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, scale < 1.0)
+        painter.drawImage(target, self._image)
+        painter.translate(target.topLeft())
+        painter.scale(scale, scale)
+        painter.setRenderHint(QPainter.Antialiasing)
+        self._paint_overlay(painter, fw, fh)
+
+    def _paint_overlay(self, painter, w, h):
+        overlay = self._overlay
+
+        # Command Mode banner
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(_qcolor((0, 220, 0) if overlay.command_mode else (30, 30, 30)))
+        painter.drawRect(QRectF(0, 0, w, BANNER_HEIGHT))
+        painter.setFont(self._banner_font)
+        painter.setPen(_qcolor((25, 25, 25) if overlay.command_mode else (200, 200, 200)))
+        painter.drawText(20, 33, BANNER_ON_TEXT if overlay.command_mode else BANNER_OFF_TEXT)
+
+        painter.setFont(self._label_font)
+        if overlay.message:
+            text, color = overlay.message
+            painter.setPen(_qcolor(color))
+            painter.drawText(40, 80, text)
+        for text, x, y, color in overlay.labels:
+            painter.setPen(_qcolor(color))
+            painter.drawText(x, y, text)
+
+        if overlay.hold_progress is not None:
+            progress = min(overlay.hold_progress, 1.0) * HOLD_BAR_WIDTH
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(_qcolor((80, 255, 80)))
+            painter.drawRect(QRectF(w - 220, h - 50, progress, 25))
+            painter.setBrush(Qt.NoBrush)
+            painter.setPen(QPen(_qcolor((60, 100, 60)), 2))
+            painter.drawRect(QRectF(w - 220, h - 50, HOLD_BAR_WIDTH, 25))
+            painter.setFont(self._small_font)
+            painter.setPen(_qcolor((200, 255, 200)))
+            painter.drawText(w - 200, h - 60, HOLD_TEXT)
+
+        # Border flash for feedback
+        if overlay.flash:
+            painter.setBrush(Qt.NoBrush)
+            painter.setPen(QPen(_qcolor((0, 255, 0)), 18))
+            painter.drawRect(QRectF(9, 9, w - 18, h - 18))
+
+
+class MainWindow(QMainWindow):
+    def __init__(self, slot, max_fps=DEFAULT_MAX_FPS, title="Gesture-Controlled Presentation"):
+        super().__init__()
+        self.slot = slot
+        self.setWindowTitle(title)
+        self.video = VideoWidget(self)
+        self.setCentralWidget(self.video)
+        self.status = QLabel()
+        self.statusBar().addPermanentWidget(self.status)
+
+        self._shown_seq = 0
+        self._painted = 0
+        self._stats_time = time.monotonic()
+        self._stats_seq = 0
+
+        # Repaint on our own clock, never faster than max_fps
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self._poll)
+        self.timer.start(max(1, int(1000 / max_fps)))
+
+    def _poll(self):
+        seq, frame, overlay = self.slot.latest()
+        if seq != self._shown_seq and frame is not None:
+            self._shown_seq = seq
+            self._painted += 1
+            self.video.set_frame(frame, overlay)
+        now = time.monotonic()
+        if now - self._stats_time >= 1.0:
+            elapsed = now - self._stats_time
+            pipeline_fps = (seq - self._stats_seq) / elapsed
+            self.status.setText(f"pipeline {pipeline_fps:.0f} fps | display {self._painted / elapsed:.0f} fps")
+            self._stats_time, self._stats_seq, self._painted = now, seq, 0
+
+    def keyPressEvent(self, event):
+        if event.key() in (Qt.Key_Q, Qt.Key_Escape):
+            self.close()
+            return
+        text = event.text().lower()
+        if text:
+            self.slot.keys.append(ord(text[0]))
+
+    def closeEvent(self, event):
+        self.slot.stop_event.set()
+        super().closeEvent(event)
+
+
+def run_qt_window(pipeline, max_fps=DEFAULT_MAX_FPS, size=(1280, 720), on_ready=None):
+    """
+    Show the main window and run pipeline(slot) in a worker thread until
+    either the window is closed or the pipeline returns.
+    """
+    app = QApplication.instance() or QApplication(sys.argv)
+    slot = FrameSlot()
+    window = MainWindow(slot, max_fps=max_fps)
+    window.resize(*size)
+    window.show()
+
+    worker = threading.Thread(target=pipeline, args=(slot,), name="gesture-pipeline", daemon=True)
+    worker.start()
+
+    # Close the window if the pipeline stops on its own (camera lost, ...)
+    watchdog = QTimer(window)
+    watchdog.timeout.connect(lambda: worker.is_alive() or window.close())
+    watchdog.start(200)
+    # Python signal handlers (SIGUSR1 profiling trigger) only run when the
+    # interpreter gets control; a no-op timer hands it control regularly
+    signal_pump = QTimer(window)
+    signal_pump.timeout.connect(lambda: None)
+    signal_pump.start(100)
+    if on_ready is not None:
+        on_ready(window)
+
+    app.exec_()
+    slot.stop_event.set()
+    worker.join(timeout=2)
+    return window
+
+
+# ------- Offscreen demo -------
+
+def _demo_pipeline(frames, fps=60):
+    import numpy as np
+
+    def pipeline(slot):
+        h, w = 720, 1280
+        ramp = np.linspace(0, 255, w, dtype=np.uint8)
+        for i in range(frames):
+            if slot.stop_event.is_set():
+                break
+            frame = np.empty((h, w, 3), dtype=np.uint8)  # new buffer each frame, never reused
+            frame[:, :, 0] = np.roll(ramp, i * 8)[None, :]
+            frame[:, :, 1] = 60
+            frame[:, :, 2] = 255 - frame[:, :, 0]
+            overlay = OverlayState(command_mode=(i // 30) % 2 == 1)
+            overlay.hold_progress = (i % 30) / 29.0 if overlay.command_mode else None
+            overlay.add_label("Peace", 600, 400, (0, 255, 0))
+            overlay.flash = i % 30 == 29
+            slot.publish(frame, overlay)
+            time.sleep(1.0 / fps)
+    return pipeline
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Gesture presentation main window")
+    parser.add_argument("--demo", action="store_true", help="show synthetic frames instead of the camera")
+    parser.add_argument("--frames", type=int, default=300, help="demo length in frames")
+    parser.add_argument("--max-fps", type=float, default=DEFAULT_MAX_FPS)
+    parser.add_argument("--snapshot", help="save the window to this image when the demo ends")
+    args = parser.parse_args(argv)
+
+    if not args.demo:
+        from gesture_recognition.main import main as run_app
+        run_app()
+        return 0
+
+    def on_ready(window):
+        if args.snapshot:
+            # Grab just before the pipeline-ends watchdog closes the window
+            original_close = window.closeEvent
+
+            def close_and_grab(event):
+                window.grab().save(args.snapshot)
+                print(f"Saved {args.snapshot}")
+                original_close(event)
+            window.closeEvent = close_and_grab
+
+    run_qt_window(_demo_pipeline(args.frames), max_fps=args.max_fps, on_ready=on_ready)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+#overlay.py
+#Per-frame overlay state, drawn by the Qt window (vector) or onto the frame (OpenCV preview)
+
+import cv2
+
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+BANNER_HEIGHT = 45
+BANNER_ON_TEXT = "COMMAND MODE: ON"
+BANNER_OFF_TEXT = "COMMAND MODE: OFF (Show Open Palm to activate)"
+HOLD_BAR_WIDTH = 200
+HOLD_TEXT = "Hold for Action"
+
+
+class OverlayState:
+    """
+    What to show on top of a frame. Colors are BGR tuples, positions are
+    pixel coordinates of the (unscaled) frame.
+    """
+
+    __slots__ = ("command_mode", "hold_progress", "flash", "message", "labels")
+
+    def __init__(self, command_mode=False):
+        self.command_mode = command_mode
+        self.hold_progress = None  # 0..1 while a hold gesture is being confirmed
+        self.flash = False         # green border after an action fired
+        self.message = None        # (text, color), e.g. ">>> COMMAND MODE ON <<<"
+        self.labels = []           # [(text, x, y, color)] next to the hand
+
+    def add_label(self, text, x, y, color):
+        self.labels.append((text, x, y, color))
+
+
+def gesture_color(gesture):
+    if "Palm" in gesture:
+        return (0, 120, 255)
+    elif "OK" in gesture:
+        return (100, 50, 245)
+    elif "fingers" in gesture or "Finger" in gesture:
+        return (120, 220, 250)
+    elif gesture in ("L Gesture", "Single Point", "C Shape", "Rock Sign"):
+        return (255, 140, 0)
+    return (0, 255, 0)
+
+
+def draw_overlay_cv2(frame, overlay):
+    """
+    Burn the overlay into the frame, for the OpenCV preview window.
+    """
+    h, w = frame.shape[:2]
+
+    # Command Mode banner
+    if overlay.command_mode:
+        cv2.rectangle(frame, (0, 0), (w, BANNER_HEIGHT), (0, 220, 0), -1)
+        cv2.putText(frame, BANNER_ON_TEXT, (20, 35), FONT, 1, (25, 25, 25), 2)
+    else:
+        cv2.rectangle(frame, (0, 0), (w, BANNER_HEIGHT), (30, 30, 30), -1)
+        cv2.putText(frame, BANNER_OFF_TEXT, (20, 35), FONT, 0.78, (200, 200, 200), 2)
+
+    if overlay.message:
+        text, color = overlay.message
+        cv2.putText(frame, text, (40, 60), FONT, 1.15, color, 3)
+
+    for text, x, y, color in overlay.labels:
+        cv2.putText(frame, text, (x, y), FONT, 1, color, 2)
+
+    if overlay.hold_progress is not None:
+        progress = min(int(overlay.hold_progress * HOLD_BAR_WIDTH), HOLD_BAR_WIDTH)
+        cv2.rectangle(frame, (w - 220, h - 50), (w - 220 + progress, h - 25), (80, 255, 80), -1)
+        cv2.rectangle(frame, (w - 220, h - 50), (w - 20, h - 25), (60, 100, 60), 2)
+        cv2.putText(frame, HOLD_TEXT, (w - 200, h - 60), FONT, 0.6, (200, 255, 200), 2)
+
+    # Draw border flash for feedback
+    if overlay.flash:
+        cv2.rectangle(frame, (0, 0), (w - 1, h - 1), (0, 255, 0), thickness=18)
+    return frame
@@ -0,0 +1,190 @@
+#profiling.py
+#On-demand cProfile / tracemalloc hooks for long sessions
+
+"""
+Runtime profiling hooks for the main loop. Nothing is imported, started or
+timed until a hook is switched on, so a disabled ProfilingHooks costs one
+attribute check per frame (`if profiler.active:`).
+
+Switches (environment variables):
+    GESTURE_PROFILE_FRAMES=300        cProfile the next 300 frames at startup; the
+                                      same window length is used for later captures
+    GESTURE_TRACEMALLOC_INTERVAL=60   tracemalloc snapshot every 60 s, diff of the top
+                                      allocation sites, warning on steady growth
+    GESTURE_PROFILE_DIR=profiles      where .prof files are written
+
+Triggers while running:
+    'p' key in the preview window, or SIGUSR1 (POSIX, also works headless)
+    starts a new cProfile window over the next N frames.
+
+.prof files are standard pstats dumps: view them with snakeviz, or turn them
+into a flamegraph with `flameprof file.prof > file.svg`.
+"""
+
+import os
+import signal
+import threading
+import time
+
+DEFAULT_PROFILE_FRAMES = 300
+DEFAULT_OUTPUT_DIR = "profiles"
+
+
+class ProfilingHooks:
+    def __init__(
+        self,
+        profile_frames=0,          # >0: start a cProfile window of this many frames immediately
+        tracemalloc_interval=0,    # >0: seconds between tracemalloc snapshots
+        output_dir=DEFAULT_OUTPUT_DIR,
+        top=10,                    # allocation sites / functions shown per report
+        growth_snapshots=5,        # consecutive increasing snapshots that count as "steady growth"
+        min_growth_bytes=1 << 20   # ...and only if they add up to at least this much
+    ):
+        self.window_frames = profile_frames or DEFAULT_PROFILE_FRAMES
+        self.tracemalloc_interval = tracemalloc_interval
+        self.output_dir = output_dir
+        self.top = top
+        self.growth_snapshots = growth_snapshots
+        self.min_growth_bytes = min_growth_bytes
+
+        self._capture_requested = profile_frames > 0
+        self._profiler = None
+        self._frames_left = 0
+        self._frame_count = 0
+        self._capture_start_frame = 0
+
+        self._tracemalloc = None
+        self._last_snapshot = None
+        self._last_snapshot_time = 0.0
+        self._memory_series = []  # traced bytes at each snapshot
+
+        if tracemalloc_interval > 0:
+            import tracemalloc
+            self._tracemalloc = tracemalloc
+            tracemalloc.start()
+            self._last_snapshot_time = time.monotonic()
+            self._last_snapshot = self._take_snapshot()
+            print(f"[INFO] tracemalloc on, snapshot every {tracemalloc_interval:g}s")
+
+        self.active = self._capture_requested or self._tracemalloc is not None
+
+    @classmethod
+    def from_env(cls, environ=None):
+        env = os.environ if environ is None else environ
+        try:
+            frames = int(env.get("GESTURE_PROFILE_FRAMES", "0") or 0)
+            interval = float(env.get("GESTURE_TRACEMALLOC_INTERVAL", "0") or 0)
+        except ValueError as e:
+            print(f"[WARN] Ignoring invalid profiling settings: {e}")
+            frames, interval = 0, 0
+        return cls(
+            profile_frames=frames,
+            tracemalloc_interval=interval,
+            output_dir=env.get("GESTURE_PROFILE_DIR", DEFAULT_OUTPUT_DIR)
+        )
+
+    # --- Triggers ---
+
+    def request_capture(self):
+        """
+        Profile the next `window_frames` frames. Safe from signal handlers.
+        """
+        self._capture_requested = True
+        self.active = True
+
+    def install_signal_handler(self):
+        """
+        SIGUSR1 -> request_capture(). No-op on platforms without SIGUSR1.
+        """
+        if not hasattr(signal, "SIGUSR1") or threading.current_thread() is not threading.main_thread():
+            return False
+        signal.signal(signal.SIGUSR1, lambda signum, frame: self.request_capture())
+        return True
+
+    def on_key(self, key):
+        if key == ord('p'):
+            self.request_capture()
+
+    # --- Per-frame hook (only call while self.active) ---
+
+    def on_frame(self):
+        self._frame_count += 1
+
+        if self._profiler is not None:
+            self._frames_left -= 1
+            if self._frames_left <= 0:
+                self._finish_capture()
+        elif self._capture_requested:
+            self._start_capture()
+
+        if self._tracemalloc is not None:
+            now = time.monotonic()
+            if now - self._last_snapshot_time >= self.tracemalloc_interval:
+                self._last_snapshot_time = now
+                self._memory_report()
+
+        self.active = (self._profiler is not None or self._capture_requested
+                       or self._tracemalloc is not None)
+
+    def close(self):
+        """
+        Flush a capture in progress and stop tracemalloc.
+        """
+        if self._profiler is not None:
+            self._finish_capture()
+        if self._tracemalloc is not None:
+            self._memory_report()
+            self._tracemalloc.stop()
+            self._tracemalloc = None
+        self.active = False
+
+    # --- cProfile window ---
+
+    def _start_capture(self):
+        import cProfile
+        self._capture_requested = False
+        self._frames_left = self.window_frames
+        self._capture_start_frame = self._frame_count
+        self._profiler = cProfile.Profile()
+        print(f"[INFO] Profiling next {self.window_frames} frames...")
+        self._profiler.enable()
+
+    def _finish_capture(self):
+        import pstats
+        self._profiler.disable()
+        frames = self._frame_count - self._capture_start_frame
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = os.path.join(self.output_dir, f"cprofile_{time.strftime('%Y%m%d_%H%M%S')}_{frames}f.prof")
+        self._profiler.dump_stats(path)
+        print(f"[INFO] Wrote profile of {frames} frames to {path}")
+        pstats.Stats(self._profiler).sort_stats("cumulative").print_stats(self.top)
+        self._profiler = None
+
+    # --- tracemalloc ---
+
+    def _take_snapshot(self):
+        tm = self._tracemalloc
+        snapshot = tm.take_snapshot().filter_traces((
+            tm.Filter(False, tm.__file__),
+            tm.Filter(False, "<frozen importlib._bootstrap>"),
+            tm.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ))
+        self._memory_series.append(tm.get_traced_memory()[0])
+        return snapshot
+
+    def _memory_report(self):
+        snapshot = self._take_snapshot()
+        current = self._memory_series[-1]
+        print(f"[INFO] tracemalloc: {current / 1024:.1f} KiB traced after {self._frame_count} frames")
+        for stat in snapshot.compare_to(self._last_snapshot, "lineno")[:self.top]:
+            if stat.size_diff:
+                print(f"    {stat}")
+        self._last_snapshot = snapshot
+
+        recent = self._memory_series[-(self.growth_snapshots + 1):]
+        if len(recent) > self.growth_snapshots:
+            increasing = all(b > a for a, b in zip(recent, recent[1:]))
+            growth = recent[-1] - recent[0]
+            if increasing and growth >= self.min_growth_bytes:
+                print(f"[WARN] Steady memory growth: +{growth / 1024:.1f} KiB over the last "
+                      f"{self.growth_snapshots} snapshots")
@@ -0,0 +1,12 @@
+#stats.py
+#Small statistics helpers shared by the benchmarks and the soak harness
+
+
+def percentile(sorted_values, p):
+    """
+    Nearest-rank percentile (p in 0..100) of an already sorted list; nan if empty.
+    """
+    if not sorted_values:
+        return float("nan")
+    idx = min(len(sorted_values) - 1, int(round(p / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
@@ -0,0 +1,64 @@
+from gesture_recognition.command_state import CommandStateMachine, MODE_ON, MODE_OFF, INSTANT, HOLD
+
+HOLD_GESTURE = "Palm Right"  # -> next_slide
+
+
+def _enter_command_mode(machine, now=0.0):
+    assert machine.update("Open Palm", now).event == MODE_ON
+
+
+def test_toggle_respects_mode_cooldown():
+    machine = CommandStateMachine(mode_cooldown=0.8)
+    _enter_command_mode(machine)
+    assert machine.update("Fist", 0.5).event is None
+    assert machine.command_mode
+    assert machine.update("Fist", 0.9).event == MODE_OFF
+    assert not machine.command_mode
+    assert machine.update("Open Palm", 1.2).event is None
+    assert machine.update("Open Palm", 1.8).event == MODE_ON
+
+
+def test_hold_fires_after_required_duration():
+    machine = CommandStateMachine(hold_duration_required=0.8)
+    _enter_command_mode(machine)
+    assert machine.update(HOLD_GESTURE, 1.0).hold_progress is None
+    step = machine.update(HOLD_GESTURE, 1.4)
+    assert step.event is None and abs(step.hold_progress - 0.5) < 1e-9
+    step = machine.update(HOLD_GESTURE, 1.8)
+    assert step.event == HOLD and step.action == "next_slide"
+
+
+def test_hold_restarts_when_gesture_changes():
+    machine = CommandStateMachine(hold_duration_required=0.8)
+    _enter_command_mode(machine)
+    machine.update(HOLD_GESTURE, 1.0)
+    machine.update(None, 1.5)
+    machine.update(HOLD_GESTURE, 1.6)
+    assert machine.update(HOLD_GESTURE, 2.0).event is None
+    assert machine.update(HOLD_GESTURE, 2.5).event == HOLD
+
+
+def test_nothing_fires_during_action_pause():
+    machine = CommandStateMachine(hold_duration_required=0.8, action_pause=0.2)
+    _enter_command_mode(machine)
+    machine.update(HOLD_GESTURE, 1.0)
+    assert machine.update(HOLD_GESTURE, 1.8).event == HOLD
+    assert machine.update("Zoom In", 1.9).event is None
+    assert machine.update("Fist", 1.95).event is None
+    assert machine.command_mode
+    assert machine.update("Zoom In", 2.05).event == INSTANT
+
+
+def test_zoom_cooldown():
+    machine = CommandStateMachine(zoom_cooldown=0.6)
+    _enter_command_mode(machine)
+    assert machine.update("Zoom Out", 1.0).action == "zoom_out"
+    assert machine.update("Zoom Out", 1.3).event is None
+    assert machine.update("Zoom In", 1.7).action == "zoom_in"
+
+
+def test_nothing_fires_outside_command_mode():
+    machine = CommandStateMachine()
+    for i in range(20):
+        assert machine.update(HOLD_GESTURE, i * 0.1).event is None
+    assert machine.update("Zoom In", 2.5).event is None
@@ -0,0 +1,125 @@
+import numpy as np
+import pytest
+
+from gesture_recognition.gesture_detector import DEFAULT_SETTINGS, GestureDetector
+from gesture_recognition.hand_features import HandFeatures
+
+FRAMES = 5000
+
+
+# Raw-landmark versions of the predicates, as the detector computed them
+# before HandFeatures: the reference the shared-geometry versions must match.
+
+def ref_fingers_up(l):
+    fingers = [l[4][0] < l[3][0]]
+    for ti, pi in zip([8, 12, 16, 20], [6, 10, 14, 18]):
+        fingers.append(l[ti][1] < l[pi][1])
+    return fingers
+
+
+def ref_is_fist(l):
+    fingers = ref_fingers_up(l)
+    thumb_dist = min(np.linalg.norm(l[4][:2] - l[0][:2]), np.linalg.norm(l[4][:2] - l[5][:2]))
+    return not any(fingers) or (not any(fingers[1:]) and thumb_dist < 0.09)
+
+
+def ref_is_thumbs_up(l):
+    fingers = ref_fingers_up(l)
+    return fingers[0] and not any(fingers[1:]) and np.linalg.norm(l[4][:2] - l[0][:2]) > 0.13
+
+
+def ref_is_ok_sign(l):
+    fingers = ref_fingers_up(l)
+    return np.linalg.norm(l[4][:2] - l[8][:2]) < 0.06 and not fingers[3] and not fingers[4]
+
+
+def ref_palm_direction(l):
+    dy = l[5][1] - l[17][1]
+    if dy > 0.03:
+        return "Palm Left"
+    if dy < -0.03:
+        return "Palm Right"
+    return None
+
+
+def ref_number_gesture(l):
+    return {3: "Three Fingers", 4: "Four Fingers", 5: "Five Fingers"}.get(sum(ref_fingers_up(l)))
+
+
+def ref_is_c_shape(l):
+    fingers = ref_fingers_up(l)
+    thumb_far = np.linalg.norm(l[4][:2] - l[0][:2]) > 0.1
+    middle_bent = l[12][1] > l[10][1]
+    return thumb_far and middle_bent and not all(fingers) and 0 < sum(fingers) < 5
+
+
+def ref_fingertip_dist_sum(l):
+    thumb, index, middle = l[4][:2], l[8][:2], l[12][:2]
+    return (np.linalg.norm(thumb - index) + np.linalg.norm(thumb - middle) + np.linalg.norm(index - middle)) / 3
+
+
+def ref_pattern(pattern):
+    return lambda l: ref_fingers_up(l) == list(pattern)
+
+
+REFERENCE = {
+    "fingers_up": lambda l: tuple(ref_fingers_up(l)),
+    "fingers_count": lambda l: sum(ref_fingers_up(l)),
+    "is_fist": ref_is_fist,
+    "is_thumbs_up": ref_is_thumbs_up,
+    "is_open_palm": lambda l: all(ref_fingers_up(l)),
+    "is_peace": ref_pattern((False, True, True, False, False)),
+    "is_ok_sign": ref_is_ok_sign,
+    "palm_direction": ref_palm_direction,
+    "number_gesture": ref_number_gesture,
+    "is_L_gesture": ref_pattern((True, True, False, False, False)),
+    "is_single_point": ref_pattern((False, True, False, False, False)),
+    "is_c_shape": ref_is_c_shape,
+    "is_rock_sign": ref_pattern((False, True, False, False, True)),
+}
+
+
+def random_hands(seed, frames=FRAMES):
+    """
+    Hands scattered around a random centre at several spreads, so the
+    distance thresholds (0.06 .. 0.13) fall on both sides.
+    """
+    rng = np.random.default_rng(seed)
+    for _ in range(frames):
+        centre = rng.uniform(0.2, 0.8, size=3)
+        spread = rng.choice([0.02, 0.05, 0.1, 0.2])
+        yield centre + rng.normal(0.0, spread, size=(21, 3))
+
+
+@pytest.mark.parametrize("name", sorted(REFERENCE))
+def test_predicate_matches_raw_landmark_reference(name):
+    detector = GestureDetector(settings=DEFAULT_SETTINGS)
+    predicate = getattr(detector, name)
+    reference = REFERENCE[name]
+    results = set()
+    for l in random_hands(seed=sorted(REFERENCE).index(name)):
+        expected = reference(l)
+        assert predicate(l) == expected
+        assert predicate(HandFeatures.of(l)) == expected
+        results.add(expected)
+    assert len(results) > 1  # the frames exercised more than one outcome
+
+
+def test_fingertip_distance_matches_raw_landmark_reference():
+    detector = GestureDetector(settings=DEFAULT_SETTINGS)
+    for l in random_hands(seed=100, frames=1000):
+        expected = ref_fingertip_dist_sum(l)
+        assert detector._fingertip_dist_sum(l) == pytest.approx(expected, abs=1e-12)
+        assert detector._fingertip_dist_sum(HandFeatures.of(l)) == pytest.approx(expected, abs=1e-12)
+
+
+def test_features_are_shared_across_predicates():
+    detector = GestureDetector(settings=DEFAULT_SETTINGS)
+    l = next(random_hands(seed=0, frames=1))
+    features = HandFeatures.of(l)
+    assert HandFeatures.of(features) is features
+    detector.is_fist(features)
+    distances = features.distances
+    detector.is_ok_sign(features)
+    detector.is_c_shape(features)
+    assert features.distances is distances
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from gesture_recognition.landmark_filters import PredictiveLandmarkFilter
+
+FPS = 30.0
+VELOCITY = np.array([0.6, -0.3, 0.0])  # normalized units per second
+
+
+def hand_at(t):
+    base = np.linspace(0.2, 0.6, 21 * 3).reshape(21, 3)
+    return base + VELOCITY * t
+
+
+def run_constant_velocity(landmark_filter, frames, now_offset=None):
+    out = None
+    for i in range(frames):
+        t = i / FPS
+        now = None if now_offset is None else t + now_offset
+        out = landmark_filter.update([hand_at(t)], t, now)
+    return t, out
+
+
+def test_constant_velocity_converges_to_true_velocity():
+    landmark_filter = PredictiveLandmarkFilter(max_num_hands=1)
+    t, out = run_constant_velocity(landmark_filter, 60)
+
+    np.testing.assert_allclose(landmark_filter.vel[0], np.broadcast_to(VELOCITY, (21, 3)), atol=1e-3)
+    np.testing.assert_allclose(out[0], hand_at(t), atol=1e-4)
+
+
+def test_output_is_extrapolated_by_latency():
+    landmark_filter = PredictiveLandmarkFilter(max_num_hands=1, max_horizon=0.2)
+    t, out = run_constant_velocity(landmark_filter, 60, now_offset=0.05)
+
+    assert landmark_filter.last_horizon == pytest.approx(0.05)
+    np.testing.assert_allclose(out[0], hand_at(t + 0.05), atol=1e-3)
+
+
+def test_extrapolation_is_capped_at_max_horizon():
+    landmark_filter = PredictiveLandmarkFilter(max_num_hands=1, max_horizon=0.2)
+    t, out = run_constant_velocity(landmark_filter, 60, now_offset=1.0)
+
+    assert landmark_filter.last_horizon == pytest.approx(0.2)
+    np.testing.assert_allclose(out[0], hand_at(t + 0.2), atol=1e-3)
+
+
+def test_no_extrapolation_before_capture_time():
+    landmark_filter = PredictiveLandmarkFilter(max_num_hands=1)
+    t, out = run_constant_velocity(landmark_filter, 60, now_offset=-0.1)
+
+    assert landmark_filter.last_horizon == 0.0
+    np.testing.assert_allclose(out[0], hand_at(t), atol=1e-4)
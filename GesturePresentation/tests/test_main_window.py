@@ -0,0 +1,78 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+import pytest
+
+pytest.importorskip("PyQt5")
+from PyQt5.QtCore import QPoint
+from PyQt5.QtWidgets import QApplication
+
+from ui.main_window import FrameSlot, MainWindow
+from ui.overlay import OverlayState
+
+FRAME_BGR = (200, 40, 10)
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def window(app):
+    slot = FrameSlot()
+    window = MainWindow(slot)
+    window.timer.stop()  # the test drives _poll() itself
+    window.resize(660, 420)
+    window.show()
+    app.processEvents()
+    yield window
+    window.close()
+
+
+def show_frame(app, window, frame, overlay):
+    window.slot.publish(frame, overlay)
+    window._poll()
+    app.processEvents()
+    return window.grab().toImage()
+
+
+def frame_to_window(window, frame, x, y):
+    """Map a frame pixel to window coordinates, following VideoWidget's letterboxing."""
+    video = window.video
+    fh, fw = frame.shape[:2]
+    scale = min(video.width() / fw, video.height() / fh)
+    left = (video.width() - fw * scale) / 2
+    top = (video.height() - fh * scale) / 2
+    return video.mapTo(window, QPoint(int(left + (x + 0.5) * scale), int(top + (y + 0.5) * scale)))
+
+
+def rgb_at(image, point):
+    color = image.pixelColor(point)
+    return color.red(), color.green(), color.blue()
+
+
+def test_frame_and_overlay_are_painted(app, window):
+    frame = np.empty((180, 320, 3), dtype=np.uint8)
+    frame[:] = FRAME_BGR
+
+    image = show_frame(app, window, frame, OverlayState(command_mode=True))
+    b, g, r = FRAME_BGR
+    assert rgb_at(image, frame_to_window(window, frame, 160, 120)) == pytest.approx((r, g, b), abs=2)
+    assert rgb_at(image, frame_to_window(window, frame, 310, 4)) == (0, 220, 0)
+
+    image = show_frame(app, window, frame, OverlayState(command_mode=False))
+    assert rgb_at(image, frame_to_window(window, frame, 310, 4)) == (30, 30, 30)
+
+
+def test_frame_is_displayed_without_copying(app, window):
+    frame = np.zeros((180, 320, 3), dtype=np.uint8)
+    show_frame(app, window, frame, OverlayState())
+
+    image = window.video._image
+    assert int(image.constBits()) == frame.ctypes.data
+    frame[100, 50] = FRAME_BGR
+    b, g, r = FRAME_BGR
+    assert image.pixelColor(50, 100).getRgb()[:3] == (r, g, b)
@@ -0,0 +1,72 @@
+from gesture_recognition.quality_controller import QualityController
+
+LEVELS = [(1, None, 2), (0, None, 2), (0, None, 1), (0, 320, 1)]
+FPS = 20
+
+
+class FakeTracker:
+    """Inference time depends only on the configured level (plus optional load factor)."""
+
+    def __init__(self, costs):
+        self.costs = costs  # level tuple -> seconds
+        self.max_num_hands = 2
+        self.level = None
+        self.load = 1.0
+        self.reconfigures = 0
+
+    def reconfigure(self, model_complexity, input_width, max_num_hands):
+        self.level = (model_complexity, input_width, max_num_hands)
+        self.reconfigures += 1
+
+    @property
+    def last_inference_time(self):
+        return self.costs[self.level] * self.load
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _run(controller, clock, seconds):
+    for _ in range(int(seconds * FPS)):
+        clock.now += 1.0 / FPS
+        controller.update()
+
+
+def _controller(costs):
+    clock = FakeClock()
+    tracker = FakeTracker(dict(zip(LEVELS, costs)))
+    return QualityController(tracker, target_fps=FPS, levels=LEVELS, clock=clock), tracker, clock
+
+
+def test_steps_down_until_within_budget():
+    controller, tracker, clock = _controller([0.080, 0.060, 0.030, 0.020])  # budget is 35 ms
+    _run(controller, clock, 60)
+    assert controller.level == 2
+
+
+def test_does_not_flap_between_neighbouring_levels():
+    # Level 2 is just over budget, level 3 has plenty of headroom
+    controller, tracker, clock = _controller([0.080, 0.060, 0.040, 0.020])
+    _run(controller, clock, 3600)
+    assert controller.level == 3
+    upgrades = [t for t, old, new, _ in controller.transitions if new < old]
+    assert len(upgrades) <= 10
+    # Retries of the failing level get further and further apart
+    gaps = [b - a for a, b in zip(upgrades, upgrades[1:])]
+    assert gaps == sorted(gaps)
+    assert controller.level_costs[2] > controller.budget
+
+
+def test_steps_back_up_when_load_drops():
+    controller, tracker, clock = _controller([0.030, 0.015, 0.010, 0.008])
+    tracker.load = 2.0
+    _run(controller, clock, 30)
+    assert controller.level > 0
+    tracker.load = 1.0
+    _run(controller, clock, 120)
+    assert controller.level == 0
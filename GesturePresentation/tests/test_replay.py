@@ -0,0 +1,46 @@
+from gesture_recognition.command_state import HOLD, INSTANT
+from gesture_recognition.gesture_detector import DEFAULT_SETTINGS
+from gesture_recognition.replay import read_session, record_synthetic, replay
+
+
+class FakeTime:
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = 0
+
+    def clock(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps += 1
+        self.now += seconds
+
+
+def test_paced_replay_matches_unpaced(tmp_path):
+    session = str(tmp_path / "session.jsonl")
+    record_synthetic(session, 60)
+
+    # Explicit settings, so the result does not depend on the local calibration file
+    unpaced = replay(read_session(session), settings=DEFAULT_SETTINGS, speed=0)
+    fake = FakeTime()
+    paced = replay(read_session(session), settings=DEFAULT_SETTINGS, speed=100,
+                   sleep=fake.sleep, clock=fake.clock)
+
+    assert fake.sleeps > 0
+    assert paced == unpaced
+    events = {event for _, _, event, _ in unpaced}
+    assert HOLD in events and INSTANT in events
+
+
+def test_replay_applies_detector_settings(tmp_path):
+    session = str(tmp_path / "session.jsonl")
+    record_synthetic(session, 60)
+
+    def zooms(events):
+        return sum(1 for _, _, event, _ in events if event == INSTANT)
+
+    default = replay(read_session(session), settings=DEFAULT_SETTINGS)
+    # Detector-side zoom cooldown longer than the session: at most the first zoom fires
+    slow = replay(read_session(session), settings={**DEFAULT_SETTINGS, "zoom_cooldown": 1e6})
+    assert zooms(default) > 1
+    assert zooms(slow) <= 1